@@ -1,29 +1,38 @@
 """
 Entry point for running the GSCM mining impact analysis pipeline.
 
-Pipeline (real-data mode):
+Pipeline (real-data mode, --real):
 1. Load survey data (Likert responses)
 2. Compute site-level construct scores (reflective constructs)
 3. Load KPI data (objective metrics)
 4. Compute site-level KPI indices (formative constructs)
 5. Merge into a single site-level dataset
+   (saved as data/outputs/site_level_merged.parquet plus a standardized copy;
+   CSV export is opt-in via --export-csv)
 6. Compute correlation table
 
-In synthetic mode:
+In synthetic mode (the default):
 - Skip steps 1–5 and instead load:
-    data/outputs/site_level_synthetic.csv
+    data/outputs/site_level_synthetic (Parquet if present, else CSV)
+- Cache raw + standardized Parquet copies of it for the analysis scripts.
 - Then compute the same correlation table on synthetic data.
 """
 
 from __future__ import annotations
 
+import argparse
 import os
 import pandas as pd
 
 from src.preprocessing.construct_scores import build_site_construct_table
 from src.preprocessing.kpi_scores import build_site_kpi_table
 from src.analysis.correlations import correlation_table
-import matplotlib.pyplot as plt  # currently unused, but kept if you plot later
+from src.data_ingestion.loader import (
+    cache_site_level_table,
+    load_site_level_table,
+    read_csv_fast,
+    table_source,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -36,21 +45,27 @@ SURVEY_PATH = os.path.join(BASE_DIR, "data", "examples", "survey_example.csv")
 KPI_PATH = os.path.join(BASE_DIR, "data", "examples", "kpis_example.csv")
 
 OUTPUT_DIR = os.path.join(BASE_DIR, "data", "outputs")
-MERGED_OUTPUT_PATH = os.path.join(OUTPUT_DIR, "site_level_merged.csv")
+MERGED_OUTPUT_PATH = os.path.join(OUTPUT_DIR, "site_level_merged.parquet")
+MERGED_CSV_PATH = os.path.join(OUTPUT_DIR, "site_level_merged.csv")
 SYNTHETIC_PATH = os.path.join(OUTPUT_DIR, "site_level_synthetic.csv")
 
 
 def load_csv_or_raise(path: str, label: str) -> pd.DataFrame:
-    """Small helper to load a CSV with a clear error if missing."""
+    """Small helper to load a CSV (PyArrow engine if available) with a clear error if missing."""
     if not os.path.exists(path):
         raise FileNotFoundError(
             f"{label} file not found at: {path}\n"
             f"Make sure the file exists or adjust the path in main.py."
         )
-    return pd.read_csv(path)
+    return read_csv_fast(path)
 
 
-def main(method: str = "simple", use_synthetic: bool = False) -> None:
+def main(
+    method: str = "simple",
+    use_synthetic: bool = False,
+    export_csv: bool = False,
+    verbose: bool = False,
+) -> None:
     """
     Run the full preprocessing pipeline or load synthetic site-level data.
 
@@ -60,7 +75,11 @@ def main(method: str = "simple", use_synthetic: bool = False) -> None:
         How to compute KPI indices in real-data mode.
     use_synthetic : bool
         If True, skip survey/KPI processing and load
-        data/outputs/site_level_synthetic.csv instead.
+        data/outputs/site_level_synthetic (Parquet or CSV) instead.
+    export_csv : bool
+        In real-data mode, also write the merged dataset as CSV for humans.
+    verbose : bool
+        If True, also print intermediate tables (heads, site_id checks).
     """
     print("\n=== GSCM Mining Impact Analysis: Site-Level Pipeline ===\n")
 
@@ -69,11 +88,24 @@ def main(method: str = "simple", use_synthetic: bool = False) -> None:
         # SYNTHETIC MODE: just load the synthetic site-level dataset
         # -------------------------------------------------------------------
         print("Running in SYNTHETIC mode.")
-        print(f"Loading synthetic site-level data from: {SYNTHETIC_PATH}")
-        merged = load_csv_or_raise(SYNTHETIC_PATH, "Synthetic site-level")
-
-        print("\n--- Synthetic Site-Level Dataset (head) ---")
-        print(merged.head())
+        print(f"Loading synthetic site-level data from: {table_source(SYNTHETIC_PATH)}")
+        try:
+            merged = load_site_level_table(SYNTHETIC_PATH)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Synthetic site-level file not found at: {SYNTHETIC_PATH}\n"
+                "Generate it first with:\n"
+                "  python src/data_generation/generate_synthetic_sites.py"
+            ) from None
+
+        # Refresh the raw + standardized Parquet copies for the analysis
+        # scripts; copies that are already fresh are not rewritten
+        if cache_site_level_table(merged, SYNTHETIC_PATH, only_stale=True):
+            print(f"Parquet caches up to date next to: {SYNTHETIC_PATH}")
+
+        if verbose:
+            print("\n--- Synthetic Site-Level Dataset (head) ---")
+            print(merged.head())
 
     else:
         # -------------------------------------------------------------------
@@ -89,9 +121,10 @@ def main(method: str = "simple", use_synthetic: bool = False) -> None:
         # 2) Compute site-level construct scores
         print("Computing site-level construct scores (reflective)...")
         site_constructs = build_site_construct_table(survey_df)
-        print("\n--- Site Construct Scores (head) ---")
-        print(site_constructs.head())
-        print("Survey constructs site_ids:", site_constructs["site_id"].unique())
+        if verbose:
+            print("\n--- Site Construct Scores (head) ---")
+            print(site_constructs.head())
+            print("Survey constructs site_ids:", site_constructs["site_id"].unique())
 
         # 3) Load KPI data
         print(f"\nLoading KPI data from: {KPI_PATH}")
@@ -101,25 +134,41 @@ def main(method: str = "simple", use_synthetic: bool = False) -> None:
         # 4) Compute site-level KPI indices
         print(f"Computing site-level KPI indices (method='{method}')...")
         site_kpis = build_site_kpi_table(kpi_df, method=method)
-        print("\n--- Site KPI Table (head) ---")
-        print(site_kpis.head())
+        if verbose:
+            print("\n--- Site KPI Table (head) ---")
+            print(site_kpis.head())
 
-        # Quick check of the dataset before merging
-        print("\nQuick site_id check before merge:")
-        print("Survey constructs site_ids:", site_constructs["site_id"].unique())
-        print("KPI site_ids:", site_kpis["site_id"].unique())
+            # Quick check of the dataset before merging
+            print("\nQuick site_id check before merge:")
+            print("Survey constructs site_ids:", site_constructs["site_id"].unique())
+            print("KPI site_ids:", site_kpis["site_id"].unique())
 
         # 5) Merge on site_id
+        # Give both tables the same categorical site_id dtype so the merge
+        # joins on integer category codes instead of hashing strings.
         print("\nMerging constructs and KPIs on 'site_id'...")
+        site_id_dtype = pd.CategoricalDtype(
+            sorted(set(site_constructs["site_id"]).union(site_kpis["site_id"]))
+        )
+        site_constructs["site_id"] = site_constructs["site_id"].astype(site_id_dtype)
+        site_kpis["site_id"] = site_kpis["site_id"].astype(site_id_dtype)
         merged = pd.merge(site_constructs, site_kpis, on="site_id", how="inner")
 
-        print("\n--- Merged Site-Level Dataset (head) ---")
-        print(merged.head())
+        if verbose:
+            print("\n--- Merged Site-Level Dataset (head) ---")
+            print(merged.head())
 
-        # 6) Save merged output (real-data merged file)
+        # 6) Save merged output (real-data merged file) as Parquet
         os.makedirs(OUTPUT_DIR, exist_ok=True)
-        merged.to_csv(MERGED_OUTPUT_PATH, index=False)
-        print(f"\nMerged dataset saved to: {MERGED_OUTPUT_PATH}\n")
+        if cache_site_level_table(merged, MERGED_OUTPUT_PATH):
+            print(f"\nMerged dataset saved to: {MERGED_OUTPUT_PATH}\n")
+        else:
+            # No Parquet engine installed: fall back to CSV so the run is kept
+            export_csv = True
+
+        if export_csv:
+            merged.to_csv(MERGED_CSV_PATH, index=False)
+            print(f"\nMerged dataset exported to: {MERGED_CSV_PATH}\n")
 
     # -----------------------------------------------------------------------
     # Correlation analysis (same for real or synthetic)
@@ -129,6 +178,27 @@ def main(method: str = "simple", use_synthetic: bool = False) -> None:
 
 
 if __name__ == "__main__":
-    # Change use_synthetic=True when you want to run the analysis on
-    # site_level_synthetic.csv instead of rebuilding from survey/KPIs.
-    main(method="weighted", use_synthetic=True)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--verbose", action="store_true",
+        help="Print intermediate tables (heads, site_id checks).",
+    )
+    parser.add_argument(
+        "--real", action="store_true",
+        help="Rebuild the merged table from the survey/KPI inputs "
+             "(real-data mode) instead of loading site_level_synthetic.",
+    )
+    parser.add_argument(
+        "--export-csv", action="store_true",
+        help="Also export the merged site-level table as CSV (needs --real).",
+    )
+    args = parser.parse_args()
+    if args.export_csv and not args.real:
+        parser.error("--export-csv exports the real-data merged table; add --real")
+
+    main(
+        method="weighted",
+        use_synthetic=not args.real,
+        export_csv=args.export_csv,
+        verbose=args.verbose,
+    )
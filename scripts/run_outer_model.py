@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import argparse
 import os
 import sys
-import pandas as pd
 
 # Path bootstrapping
 THIS_FILE = os.path.abspath(__file__)
@@ -12,24 +12,26 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from src.analysis.outer_model import compute_outer_model
+from src.data_ingestion.loader import load_table, table_source
 
 DATA_PATH = os.path.join(PROJECT_ROOT, "data", "outputs", "survey_synthetic.csv")
 
 
-def main() -> None:
+def main(verbose: bool = False) -> None:
     print(f"Project root: {PROJECT_ROOT}")
-    print(f"Loading synthetic survey data from: {DATA_PATH}")
+    print(f"Loading synthetic survey data from: {table_source(DATA_PATH)}")
 
-    if not os.path.exists(DATA_PATH):
+    try:
+        df = load_table(DATA_PATH)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Could not find synthetic survey at:\n  {DATA_PATH}\n"
             "Generate it first with:\n"
             "  python src/data_generation/generate_synthetic_survey.py"
-        )
-
-    df = pd.read_csv(DATA_PATH)
-    print("\n--- Survey head ---")
-    print(df.head())
+        ) from None
+    if verbose:
+        print("\n--- Survey head ---")
+        print(df.head())
 
     stats_df = compute_outer_model(df)
 
@@ -38,4 +40,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Outer-model statistics on the synthetic survey.")
+    parser.add_argument("--verbose", action="store_true", help="Print the head of the input data.")
+    main(verbose=parser.parse_args().verbose)
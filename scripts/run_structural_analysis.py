@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import argparse
 import os
 import sys
-import pandas as pd
 
 # -------------------------------------------------------------------
 # Make sure we can import `src.*` no matter where we run from
@@ -20,6 +20,7 @@ if PROJECT_ROOT not in sys.path:
 
 # Now we can safely import from src.*
 from src.analysis.structural_paths import run_structural_paths
+from src.data_ingestion.loader import load_site_level_table, table_source
 
 # -------------------------------------------------------------------
 # Paths
@@ -28,25 +29,28 @@ from src.analysis.structural_paths import run_structural_paths
 DATA_PATH = os.path.join(PROJECT_ROOT, "data", "outputs", "site_level_synthetic.csv")
 
 
-def main() -> None:
+def main(verbose: bool = False) -> None:
     print(f"Project root detected as: {PROJECT_ROOT}")
-    print(f"Loading synthetic site-level data from: {DATA_PATH}")
+    print(f"Loading synthetic site-level data from: {table_source(DATA_PATH)}")
 
-    if not os.path.exists(DATA_PATH):
+    try:
+        df = load_site_level_table(DATA_PATH)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Could not find synthetic data at:\n  {DATA_PATH}\n"
             "Make sure you have generated it first, e.g. by running:\n"
             "  python src/data_generation/generate_synthetic_sites_realistic.py"
-        )
+        ) from None
 
-    df = pd.read_csv(DATA_PATH)
-
-    print("\n--- Data head ---")
-    print(df.head())
+    if verbose:
+        print("\n--- Data head ---")
+        print(df.head())
 
     print("\nRunning structural path analysis...")
     run_structural_paths(df)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Structural path analysis on synthetic site-level data.")
+    parser.add_argument("--verbose", action="store_true", help="Print the head of the input data.")
+    main(verbose=parser.parse_args().verbose)
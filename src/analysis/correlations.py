@@ -1,6 +1,22 @@
+import numpy as np
 import pandas as pd
 
 def correlation_table(df: pd.DataFrame):
     numeric = df.select_dtypes(include="number")
-    corr = numeric.corr().round(2)
+    A = numeric.to_numpy(dtype=np.float32, copy=True)
+    if A.shape[0] == 0 or np.isnan(A).any():
+        # Pairwise-complete handling of missing values needs pandas
+        return numeric.corr().round(2)
+
+    # With z-standardized columns the correlation matrix is Zᵀ Z / n; the
+    # matmul runs in FP32, the mean/std reductions accumulate in FP64
+    A -= A.mean(axis=0, dtype=np.float64)
+    std = A.std(axis=0, ddof=0, dtype=np.float64)
+    zero_var = std == 0
+    A[:, ~zero_var] /= std[~zero_var]
+    C = (A.T @ A).astype(np.float64) / A.shape[0]
+    C[zero_var, :] = np.nan
+    C[:, zero_var] = np.nan
+
+    corr = pd.DataFrame(C, index=numeric.columns, columns=numeric.columns).round(2)
     return corr
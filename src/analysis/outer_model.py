@@ -19,11 +19,19 @@ from __future__ import annotations
 
 import os
 import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    import numba
+except ImportError:  # numba is optional; the NumPy kernel is used instead
+    numba = None
+
 # ---------------------------------------------------------------------------
 # Make sure the project root is on sys.path so `src` can be imported
 # ---------------------------------------------------------------------------
@@ -38,11 +46,170 @@ if PROJECT_ROOT not in sys.path:
 from src.config.model_config import CONSTRUCTS, ConstructConfig
 
 
+# Below this many indicator cells, thread start-up costs more than the
+# per-construct work it would overlap.
+_PARALLEL_MIN_CELLS = 1_000_000
+
 
 # ---------------------------------------------------------------------------
 # Low-level helpers
 # ---------------------------------------------------------------------------
 
+def _standardize_items(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Z-score the columns of a float32 item matrix.
+
+    Mean/std reductions accumulate in FP64; the returned Z stays FP32 so the
+    loadings matmul runs on half-width inputs. Zero-variance columns are left
+    at 0. Returns (Z, std) with the population std of each column.
+    """
+    std = a.std(axis=0, ddof=0, dtype=np.float64)
+    valid = std > 0
+    Z = np.zeros_like(a)
+    Z[:, valid] = (a[:, valid] - a[:, valid].mean(axis=0, dtype=np.float64)) / std[valid]
+    return Z, std
+
+
+def _construct_stats_numpy(
+    Z: np.ndarray,
+    std: np.ndarray,
+) -> Tuple[np.ndarray, float, float, float]:
+    """
+    Loadings vector, CR, AVE and Cronbach's alpha from standardized items.
+
+    Z holds the z-scored items and std their population std (as returned by
+    _standardize_items). Loadings of zero-variance items are NaN.
+    """
+    n, k = Z.shape
+    valid = std > 0
+
+    # Construct composite = mean of standardized indicators
+    composite = Z.mean(axis=1, dtype=np.float64).astype(np.float32)
+    composite_std = composite.std(ddof=0, dtype=np.float64)
+
+    # Each standardized column has unit variance and zero mean, so its Pearson
+    # correlation with the composite reduces to Zᵀc / (n · std(c)).
+    loadings_vec = np.full(k, np.nan, dtype=np.float64)
+    if composite_std > 0:
+        loadings_vec[valid] = (Z[:, valid].T @ composite) / (n * composite_std)
+
+    # Prepare λ (loadings) for CR and AVE (drop NaN)
+    lambdas = loadings_vec[~np.isnan(loadings_vec)]
+    if lambdas.size == 0:
+        cr, ave = np.nan, np.nan
+    else:
+        # Σ λ_i² in one fused multiply-reduce; Σ θ_i = k - Σ λ_i² since the
+        # error variances are θ_i = 1 - λ_i² (standardized indicators).
+        sq = float(np.einsum("i,i->", lambdas, lambdas))
+        s = float(lambdas.sum())
+
+        num = s * s
+        den = num + (lambdas.size - sq)
+        cr = num / den if den != 0 else np.nan
+        ave = sq / lambdas.size
+
+    # Alpha on the raw items: centred item i is Z_i * std_i, and the n/(n-1)
+    # factors of the ddof=1 variances cancel in the ratio.
+    alpha = np.nan
+    if k >= 2:
+        total_var = (Z @ std).var()
+        if total_var > 0:
+            alpha = float((k / (k - 1.0)) * (1.0 - (std**2).sum() / total_var))
+
+    return loadings_vec, cr, ave, alpha
+
+
+if numba is not None:
+    @numba.njit(
+        numba.types.Tuple((numba.float64[::1], numba.float64, numba.float64, numba.float64))(
+            numba.float32[:, ::1], numba.float64[::1]
+        ),
+        cache=True,
+        nogil=True,
+        # No "nnan"/"ninf": NaN loadings mark zero-variance items
+        fastmath={"reassoc", "contract"},
+    )
+    def _construct_stats_jit(Z, std):
+        """Single-pass compiled equivalent of _construct_stats_numpy."""
+        n, k = Z.shape
+
+        composite = np.empty(n)
+        total = np.empty(n)
+        for r in range(n):
+            c = 0.0
+            t = 0.0
+            for j in range(k):
+                z = np.float64(Z[r, j])
+                c += z
+                t += z * std[j]
+            composite[r] = c / k
+            total[r] = t
+
+        c_mean = composite.mean()
+        t_mean = total.mean()
+        c_var = 0.0
+        t_var = 0.0
+        for r in range(n):
+            c_var += (composite[r] - c_mean) ** 2
+            t_var += (total[r] - t_mean) ** 2
+        composite_std = np.sqrt(c_var / n)
+        total_var = t_var / n
+
+        loadings = np.full(k, np.nan)
+        if composite_std > 0:
+            for j in range(k):
+                if std[j] > 0:
+                    acc = 0.0
+                    for r in range(n):
+                        acc += Z[r, j] * composite[r]
+                    loadings[j] = acc / (n * composite_std)
+
+        s = 0.0
+        sq = 0.0
+        m = 0
+        for j in range(k):
+            if not np.isnan(loadings[j]):
+                s += loadings[j]
+                sq += loadings[j] * loadings[j]
+                m += 1
+        cr = np.nan
+        ave = np.nan
+        if m > 0:
+            num = s * s
+            den = num + (m - sq)
+            if den != 0:
+                cr = num / den
+            ave = sq / m
+
+        alpha = np.nan
+        if k >= 2 and total_var > 0:
+            item_var_sum = 0.0
+            for j in range(k):
+                item_var_sum += std[j] * std[j]
+            alpha = (k / (k - 1.0)) * (1.0 - item_var_sum / total_var)
+
+        return loadings, cr, ave, alpha
+else:
+    _construct_stats_jit = None
+
+
+def _compute_construct_stats(
+    Z: np.ndarray,
+    std: np.ndarray,
+) -> Tuple[np.ndarray, float, float, float]:
+    """
+    Loadings vector, CR, AVE and alpha for one construct's standardized items.
+
+    Uses the Numba kernel when numba is installed, NumPy otherwise.
+    """
+    if _construct_stats_jit is not None:
+        return _construct_stats_jit(
+            np.ascontiguousarray(Z, dtype=np.float32),
+            np.ascontiguousarray(std, dtype=np.float64),
+        )
+    return _construct_stats_numpy(Z, std)
+
+
 def _cronbach_alpha(X: pd.DataFrame) -> float:
     """
     Compute Cronbach's alpha for a set of items (columns) in X.
@@ -51,20 +218,9 @@ def _cronbach_alpha(X: pd.DataFrame) -> float:
 
     Returns NaN if there are fewer than 2 items or total variance is zero.
     """
-    k = X.shape[1]
-    if k < 2:
-        return np.nan
-
-    # Use sample variance (ddof=1) for items and total
-    item_vars = X.var(ddof=1)
-    total_score = X.sum(axis=1)
-    total_var = total_score.var(ddof=1)
-
-    if total_var == 0 or np.isnan(total_var):
-        return np.nan
-
-    alpha = (k / (k - 1.0)) * (1.0 - item_vars.sum() / total_var)
-    return float(alpha)
+    # Likert items are exact in FP32; variance reductions run in FP64
+    Z, std = _standardize_items(X.to_numpy(dtype=np.float32))
+    return _compute_construct_stats(Z, std)[3]
 
 
 def _compute_loadings_cr_ave(X: pd.DataFrame) -> Tuple[Dict[str, float], float, float]:
@@ -83,37 +239,98 @@ def _compute_loadings_cr_ave(X: pd.DataFrame) -> Tuple[Dict[str, float], float,
     if X.shape[1] == 0:
         return {}, np.nan, np.nan
 
-    # Standardize indicators
-    Z = (X - X.mean()) / X.std(ddof=0)
-    # If any column has zero variance, std will be 0 → replace with 0
-    Z = Z.fillna(0.0)
+    Z, std = _standardize_items(X.to_numpy(dtype=np.float32))
+    loadings_vec, cr, ave, _ = _compute_construct_stats(Z, std)
+    loadings: Dict[str, float] = dict(zip(X.columns, loadings_vec.tolist()))
 
-    # Construct composite = mean of standardized indicators
-    composite = Z.mean(axis=1)
-
-    loadings: Dict[str, float] = {}
-    for col in Z.columns:
-        x = Z[col]
-        # Pearson correlation with the composite; guard for degenerate case
-        if x.std(ddof=0) == 0 or composite.std(ddof=0) == 0:
-            l = np.nan
-        else:
-            l = float(x.corr(composite))
-        loadings[col] = l
+    return loadings, cr, ave
 
-    # Prepare λ (loadings) for CR and AVE (drop NaN)
-    lambdas = np.array([v for v in loadings.values() if not np.isnan(v)])
-    if lambdas.size == 0:
-        return loadings, np.nan, np.nan
 
-    theta = 1.0 - lambdas**2  # error variances (assuming standardized indicators)
+@lru_cache(maxsize=32)
+def _indicator_layout(
+    construct_codes: Tuple[str, ...],
+    columns: Tuple[str, ...],
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Tuple[str, ...], Tuple[int, ...]], ...]]:
+    """
+    Resolve which indicator columns are present for each construct.
+
+    Returns (all_cols, layout) where all_cols lists every present indicator
+    once and layout holds (code, indicator_cols, positions in all_cols) per
+    construct. Cached on the column tuple so repeated calls on same-shaped
+    frames (e.g. bootstrap resamples) skip the config scan.
+    """
+    present = frozenset(columns)
+    all_cols = tuple(dict.fromkeys(
+        col
+        for code in construct_codes
+        for col in CONSTRUCTS[code].indicators
+        if col in present
+    ))
+    col_to_idx = {col: i for i, col in enumerate(all_cols)}
+
+    layout = []
+    for code in construct_codes:
+        indicator_cols = tuple(col for col in CONSTRUCTS[code].indicators if col in present)
+        layout.append((code, indicator_cols, tuple(col_to_idx[col] for col in indicator_cols)))
 
-    num = (lambdas.sum())**2
-    den = num + theta.sum()
-    cr = float(num / den) if den != 0 else np.nan
-    ave = float((lambdas**2).mean())
+    return all_cols, tuple(layout)
 
-    return loadings, cr, ave
+
+def _outer_model_stats(
+    A_full: np.ndarray,
+    layout: Tuple[Tuple[str, Tuple[str, ...], Tuple[int, ...]], ...],
+) -> List[Tuple[str, Tuple[str, ...], int, Tuple[np.ndarray, float, float, float]]]:
+    """
+    Per-construct statistics for a float32 indicator matrix.
+
+    A_full holds the columns all_cols of _indicator_layout and layout its
+    per-construct positions. Returns (code, indicator_cols, n_obs,
+    (loadings, cr, ave, alpha)) for every construct with at least 2 present
+    indicators and at least one complete row.
+    """
+    missing = np.isnan(A_full)
+    # Standardize every present indicator once; each construct then works on a
+    # column slice of the shared matrices instead of re-standardizing its own
+    # DataFrame.
+    Z_full, std_full = _standardize_items(A_full)
+
+    # Collect each construct's standardized block first
+    jobs = []
+    for code, indicator_cols, idx in layout:
+        # Only indicator columns that are present in df
+        if len(indicator_cols) < 2:
+            # Need at least 2 items for alpha / CR / AVE
+            # We still could compute loadings with 1 item, but it's not
+            # meaningful as a reflective construct. Skip or log.
+            continue
+
+        idx = list(idx)
+        complete = ~missing[:, idx].any(axis=1)
+        n_obs = int(complete.sum())
+        if n_obs == 0:
+            continue
+
+        if n_obs == len(complete):
+            # No listwise deletion needed: reuse the shared z-scores
+            Z, std = Z_full[:, idx], std_full[idx]
+        else:
+            # Rows dropped for this construct shift its means/stds
+            Z, std = _standardize_items(A_full[complete][:, idx])
+
+        jobs.append((code, indicator_cols, n_obs, Z, std))
+
+    # Constructs are independent; both the Numba kernel (nogil) and the
+    # NumPy path release the GIL, so large surveys run them on threads.
+    if len(jobs) > 1 and A_full.size >= _PARALLEL_MIN_CELLS:
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            stats = list(pool.map(lambda job: _compute_construct_stats(job[3], job[4]), jobs))
+    else:
+        stats = [_compute_construct_stats(Z, std) for _, _, _, Z, std in jobs]
+
+    return [
+        (code, indicator_cols, n_obs, stat)
+        for (code, indicator_cols, n_obs, _, _), stat in zip(jobs, stats)
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -149,31 +366,21 @@ def compute_outer_model(
     if construct_codes is None:
         construct_codes = list(CONSTRUCTS.keys())
 
-    results: List[Dict[str, float]] = []
+    all_cols, layout = _indicator_layout(tuple(construct_codes), tuple(df.columns))
+    A_full = df[list(all_cols)].to_numpy(dtype=np.float32)
 
-    for code in construct_codes:
+    results: List[Dict[str, float]] = []
+    for code, indicator_cols, n_obs, (loadings_vec, cr, ave, alpha) in _outer_model_stats(
+        A_full, layout
+    ):
         cfg: ConstructConfig = CONSTRUCTS[code]
-
-        # Select indicator columns that are present in df
-        indicator_cols = [col for col in cfg.indicators if col in df.columns]
-        if len(indicator_cols) < 2:
-            # Need at least 2 items for alpha / CR / AVE
-            # We still could compute loadings with 1 item, but it's not
-            # meaningful as a reflective construct. Skip or log.
-            continue
-
-        X = df[indicator_cols].dropna()
-        if X.empty:
-            continue
-
-        alpha = _cronbach_alpha(X)
-        loadings, cr, ave = _compute_loadings_cr_ave(X)
+        loadings = dict(zip(indicator_cols, loadings_vec.tolist()))
 
         row: Dict[str, float] = {
             "construct": code,
             "name": cfg.name,
             "n_indicators": len(indicator_cols),
-            "n_obs": len(X),
+            "n_obs": n_obs,
             "alpha": alpha,
             "cr": cr,
             "ave": ave,
@@ -188,6 +395,171 @@ def compute_outer_model(
     return pd.DataFrame(results)
 
 
+def _bootstrap_batch(
+    A: np.ndarray,
+    layout: Tuple[Tuple[str, Tuple[str, ...], Tuple[int, ...]], ...],
+    slots: Dict[str, np.ndarray],
+    n_stats: int,
+    row_draws: np.ndarray,
+) -> np.ndarray:
+    """
+    (len(row_draws), n_stats) matrix of outer-model stats, one row per resample.
+
+    slots maps each construct code to the positions of its [alpha, cr, ave,
+    loadings...] in the stat vector; statistics a resample cannot compute
+    stay NaN.
+    """
+    out = np.full((len(row_draws), n_stats), np.nan)
+    for b, rows in enumerate(row_draws):
+        for code, _, _, (loadings_vec, cr, ave, alpha) in _outer_model_stats(A[rows], layout):
+            pos = slots.get(code)
+            if pos is not None:
+                out[b, pos[:3]] = (alpha, cr, ave)
+                out[b, pos[3:]] = loadings_vec
+    return out
+
+
+def _stack_stats(stats: pd.DataFrame, stat_cols: List[str]) -> pd.Series:
+    """
+    Long (construct, statistic) -> value view of a compute_outer_model frame.
+
+    Only statistics that exist for a construct are kept: alpha, cr, ave and
+    the loadings of its own indicators. A NaN value (e.g. the loading of a
+    zero-variance item) is kept as NaN.
+    """
+    long = stats.melt(id_vars="construct", value_vars=stat_cols, var_name="statistic")
+    own_loadings = {
+        (code, f"loading_{ind}")
+        for code in stats["construct"]
+        for ind in CONSTRUCTS[code].indicators
+    }
+    keep = long["statistic"].isin(("alpha", "cr", "ave")).to_numpy() | np.array(
+        [pair in own_loadings for pair in zip(long["construct"], long["statistic"])],
+        dtype=bool,
+    )
+    return long[keep].set_index(["construct", "statistic"])["value"]
+
+
+def compute_outer_model_bootstrap(
+    df: pd.DataFrame,
+    construct_codes: List[str] | None = None,
+    n_boot: int = 1000,
+    ci: float = 0.95,
+    random_seed: int = 42,
+    n_batches: int | None = None,
+) -> pd.DataFrame:
+    """
+    Bootstrap percentile confidence intervals for the outer-model statistics.
+
+    Respondents (rows) are resampled with replacement n_boot times and
+    the outer-model statistics are re-computed on each resample. Resamples
+    are grouped into n_batches independent dask.delayed tasks (default: one
+    per CPU) run in worker processes; with a single batch or without dask
+    the batches run serially.
+
+    Args:
+        df:
+            Respondent-level survey DataFrame (as for compute_outer_model).
+        construct_codes:
+            Optional list of construct codes to restrict the analysis.
+        n_boot:
+            Number of bootstrap resamples.
+        ci:
+            Confidence level of the percentile interval.
+        random_seed:
+            RNG seed for reproducibility.
+        n_batches:
+            Number of parallel tasks to split the resamples into. Worker
+            processes are spawned, so scripts calling this with more than
+            one batch need an ``if __name__ == "__main__":`` guard.
+
+    Raises:
+        ValueError if n_boot < 1 or ci is not strictly between 0 and 1.
+
+    Returns:
+        DataFrame with one row per (construct, statistic), where statistic is
+        alpha, cr, ave or loading_<indicator_name>:
+            - construct
+            - statistic
+            - estimate   (full-sample value)
+            - boot_mean
+            - boot_se
+            - ci_lower
+            - ci_upper
+        Statistics whose full-sample estimate is NaN (e.g. loadings of
+        zero-variance items) are kept, with NaN bootstrap summaries.
+    """
+    if n_boot < 1:
+        raise ValueError(f"n_boot must be at least 1, got {n_boot}")
+    if not 0.0 < ci < 1.0:
+        raise ValueError(f"ci must be strictly between 0 and 1, got {ci}")
+
+    if construct_codes is None:
+        construct_codes = list(CONSTRUCTS.keys())
+
+    estimate = compute_outer_model(df, construct_codes)
+    if estimate.empty:
+        return pd.DataFrame(
+            columns=["construct", "statistic", "estimate", "boot_mean",
+                     "boot_se", "ci_lower", "ci_upper"]
+        )
+    meta_cols = {"construct", "name", "n_indicators", "n_obs"}
+    stat_cols = [c for c in estimate.columns if c not in meta_cols]
+    est = _stack_stats(estimate, stat_cols)
+
+    # Each resample fills a fixed-order float64 vector aligned on est.index
+    all_cols, layout = _indicator_layout(tuple(construct_codes), tuple(df.columns))
+    estimated = set(estimate["construct"])
+    slots = {
+        code: est.index.get_indexer(
+            [(code, "alpha"), (code, "cr"), (code, "ave")]
+            + [(code, f"loading_{ind}") for ind in indicator_cols]
+        )
+        for code, indicator_cols, _ in layout
+        if code in estimated
+    }
+
+    # Only the indicator matrix travels to the workers
+    A = df[list(all_cols)].to_numpy(dtype=np.float32)
+
+    rng = np.random.default_rng(random_seed)
+    draws = rng.integers(0, len(A), size=(n_boot, len(A)))
+    n_batches = n_batches or os.cpu_count() or 1
+    batches = [b for b in np.array_split(draws, n_batches) if len(b)]
+
+    try:
+        import dask
+    except ImportError:  # dask is optional; batches then run serially
+        dask = None
+
+    if dask is not None and len(batches) > 1:
+        # The per-resample Python loop holds the GIL between kernels, so
+        # batches run in worker processes rather than threads
+        A_shared = dask.delayed(A, pure=True)
+        tasks = [
+            dask.delayed(_bootstrap_batch, pure=True)(A_shared, layout, slots, len(est), b)
+            for b in batches
+        ]
+        batch_results = dask.compute(*tasks, scheduler="processes")
+    else:
+        batch_results = [_bootstrap_batch(A, layout, slots, len(est), b) for b in batches]
+
+    # (n_stats, n_boot) matrix aligned on the full-sample statistics
+    boot = np.vstack(batch_results).T
+
+    tail = (1.0 - ci) / 2.0 * 100.0
+    out = est.rename("estimate").reset_index()
+    with warnings.catch_warnings():
+        # All-NaN rows (NaN statistics) and n_boot=1 (no spread) give NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        lower, upper = np.nanpercentile(boot, [tail, 100.0 - tail], axis=1)
+        out["boot_mean"] = np.nanmean(boot, axis=1)
+        out["boot_se"] = np.nanstd(boot, axis=1, ddof=1)
+    out["ci_lower"] = lower
+    out["ci_upper"] = upper
+    return out
+
+
 if __name__ == "__main__":
     # Small demo using data/examples/survey_example.csv, if it exists.
     import os
@@ -195,14 +567,16 @@ if __name__ == "__main__":
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     SYNTH_PATH = os.path.join(BASE_DIR, "data", "outputs", "survey_synthetic.csv")
 
-    if not os.path.exists(SYNTH_PATH):
+    from src.data_ingestion.loader import load_table, table_source
+
+    print(f"Loading synthetic survey data from: {table_source(SYNTH_PATH)}")
+    try:
+        demo_df = load_table(SYNTH_PATH)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Synthetic survey not found: {SYNTH_PATH}\n"
             "Run the synthetic survey generator first."
-        )
-
-    print(f"Loading synthetic survey data from: {SYNTH_PATH}")
-    demo_df = pd.read_csv(SYNTH_PATH)
+        ) from None
 
 
     outer_stats = compute_outer_model(demo_df)
@@ -1,32 +1,69 @@
 from __future__ import annotations
 
+import argparse
+import hashlib
 import os
+import sys
+from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
 from sklearn.cross_decomposition import PLSRegression
 from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import r2_score
 
 
 # Adjust BASE_DIR depth if your project layout changes
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 INPUT_PATH = os.path.join(BASE_DIR, "data", "outputs", "site_level_synthetic.csv")
 
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
 
-def main() -> None:
-    print(f"Loading synthetic site-level data from: {INPUT_PATH}")
-    df = pd.read_csv(INPUT_PATH)
+from src.analysis.correlations import correlation_table  # noqa: E402
+from src.data_ingestion.loader import (  # noqa: E402
+    load_site_level_table,
+    load_standardized_table,
+    table_source,
+)
 
-    # === 1. Basic sanity checks ===
-    print("\n=== Head ===")
-    print(df.head())
 
-    print("\n=== Describe ===")
-    print(df.describe().T.round(3))
+# In-process memo of StandardScaler outputs, keyed by a digest of the input
+# bytes. Repeated main() calls (e.g. tuning n_components in a notebook)
+# reuse the scaled arrays instead of re-fitting on identical data.
+_SCALED_CACHE: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+_SCALED_CACHE_SIZE = 4
 
-    print("\n=== Correlation matrix (numeric columns only) ===")
-    numeric_df = df.select_dtypes(include="number")
-    print(numeric_df.corr().round(2))
+
+def _fit_transform_cached(values: np.ndarray) -> np.ndarray:
+    """StandardScaler().fit_transform(values), memoized on the array contents."""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    h = hashlib.blake2b(values.tobytes(), digest_size=16)
+    h.update(repr(values.shape).encode())
+    key = h.digest()
+
+    if key in _SCALED_CACHE:
+        _SCALED_CACHE.move_to_end(key)
+        return _SCALED_CACHE[key]
+
+    scaled = StandardScaler().fit_transform(values)
+    scaled.flags.writeable = False  # shared between callers
+    _SCALED_CACHE[key] = scaled
+    if len(_SCALED_CACHE) > _SCALED_CACHE_SIZE:
+        _SCALED_CACHE.popitem(last=False)
+    return scaled
+
+
+def main(verbose: bool = False) -> None:
+    print(f"Loading synthetic site-level data from: {table_source(INPUT_PATH)}")
+    df = load_site_level_table(INPUT_PATH)
+
+    # === 1. Basic sanity checks (only computed when printed) ===
+    if verbose:
+        print("\n=== Head ===")
+        print(df.head())
+
+        print("\n=== Describe ===")
+        print(df.describe().T.round(3))
 
     # === 2. Define GSCM predictors and outcome variables ===
     # Adjust these names if needed to match your actual columns
@@ -41,6 +78,11 @@ def main() -> None:
         if col not in df.columns:
             raise ValueError(f"Expected column '{col}' not found in synthetic dataset.")
 
+    if verbose:
+        # Only the block the model uses, via one standardized Zᵀ Z product
+        print("\n=== Correlation matrix (model columns) ===")
+        print(correlation_table(df[gscm_cols + outcome_cols]))
+
     X = df[gscm_cols].copy()
     Y = df[outcome_cols].copy()
 
@@ -52,11 +94,16 @@ def main() -> None:
     print(f"\nUsing {len(X)} rows after dropping NA.")
 
     # === 3. Standardise X and Y ===
-    X_scaler = StandardScaler()
-    Y_scaler = StandardScaler()
-
-    X_scaled = X_scaler.fit_transform(X)
-    Y_scaled = Y_scaler.fit_transform(Y)
+    # Reuse the z-scored cache written by main.py when it covers exactly
+    # these rows; otherwise fit the scalers here.
+    cached = load_standardized_table(INPUT_PATH)
+    if cached is not None and len(cached) == len(df) == len(data):
+        print("Using cached standardized table.")
+        X_scaled = cached[gscm_cols].to_numpy()
+        Y_scaled = cached[outcome_cols].to_numpy()
+    else:
+        X_scaled = _fit_transform_cached(X.to_numpy(dtype=np.float64))
+        Y_scaled = _fit_transform_cached(Y.to_numpy(dtype=np.float64))
 
     # Number of components – min(#predictors, #outcomes, n_samples-1)
     n_components = min(len(gscm_cols), len(outcome_cols), len(X) - 1)
@@ -65,12 +112,16 @@ def main() -> None:
     pls.fit(X_scaled, Y_scaled)
 
     Y_pred_scaled = pls.predict(X_scaled)
-    Y_pred = Y_scaler.inverse_transform(Y_pred_scaled)
 
     # === 4. Evaluate: R² per outcome ===
+    # R² = 1 - SSR/SST for every outcome column at once. R² is invariant to
+    # the affine scaling applied to Y and its predictions, so compute it in
+    # standardised space and skip the inverse transform.
     print("\n=== R² by outcome ===")
-    for i, col in enumerate(outcome_cols):
-        r2 = r2_score(Y.iloc[:, i], Y_pred[:, i])
+    ss_res = ((Y_scaled - Y_pred_scaled) ** 2).sum(axis=0)
+    ss_tot = ((Y_scaled - Y_scaled.mean(axis=0)) ** 2).sum(axis=0)
+    r2_vec = 1.0 - ss_res / ss_tot
+    for col, r2 in zip(outcome_cols, r2_vec):
         print(f"{col}: R² = {r2:.3f}")
 
     # === 5. Inspect loadings / coefficients ===
@@ -109,4 +160,9 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Site-level PLS regression on synthetic data.")
+    parser.add_argument(
+        "--verbose", action="store_true",
+        help="Print head, describe() and the correlation matrix.",
+    )
+    main(verbose=parser.parse_args().verbose)
@@ -1,14 +1,58 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+
+# Smallest allowed ratio of Cholesky pivots (diagonal of the factor L).
+# κ(XᵀX) is roughly (max / min pivot)², so 1e-5 keeps κ(XᵀX) ≲ 1e10 and
+# leaves the normal equations ~6 significant digits; below that lstsq is used.
+_CHOLESKY_RTOL = 1e-5
+
+
+def _ols_fit(y_clean: np.ndarray, X_clean: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    OLS with intercept on NaN-free float arrays.
+
+    Solves the normal equations (XᵀX) β = Xᵀy by Cholesky and falls back to
+    numpy.linalg.lstsq if XᵀX is singular. y_clean may be 2-D (n, m) to fit
+    m targets that share the same design in one factorization.
+
+    Returns:
+        (coef, r2) where coef[0] is the intercept. For 2-D y_clean, coef has
+        one column and r2 one entry per target.
+    """
+    # Add intercept
+    X_design = np.column_stack([np.ones(len(X_clean)), X_clean])
+
+    # With only a handful of predictors, factoring the small p×p Gram matrix
+    # is much cheaper than the SVD lstsq runs on the full n×p design.
+    try:
+        factor = cho_factor(X_design.T @ X_design)
+        # Near-collinear predictors can still factor in floating point;
+        # treat a tiny pivot as singular so lstsq handles the rank deficiency.
+        pivots = np.abs(np.diag(factor[0]))
+        if pivots.min() <= _CHOLESKY_RTOL * pivots.max():
+            raise LinAlgError("ill-conditioned normal equations")
+        coef = cho_solve(factor, X_design.T @ y_clean)
+    except LinAlgError:
+        coef, residuals, rank, s = np.linalg.lstsq(X_design, y_clean, rcond=None)
+
+    y_pred = X_design @ coef
+    ss_res = np.sum((y_clean - y_pred) ** 2, axis=0)
+    ss_tot = np.sum((y_clean - y_clean.mean(axis=0)) ** 2, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(ss_tot > 0, 1 - ss_res / ss_tot, np.nan)
+
+    return coef, r2[()]
 
 
 def _ols_regression(y: pd.Series, X: pd.DataFrame) -> Dict:
     """
-    Simple OLS using numpy.linalg.lstsq.
+    Simple OLS (see _ols_fit) on pandas inputs.
     Adds an intercept term automatically.
 
     Returns:
@@ -16,18 +60,10 @@ def _ols_regression(y: pd.Series, X: pd.DataFrame) -> Dict:
     """
     # Drop rows with NaN in any relevant column
     data = pd.concat([y, X], axis=1).dropna()
-    y_clean = data.iloc[:, 0].values
-    X_clean = data.iloc[:, 1:].values
-
-    # Add intercept
-    X_design = np.column_stack([np.ones(len(X_clean)), X_clean])
+    y_clean = data.iloc[:, 0].to_numpy(dtype=np.float64)
+    X_clean = data.iloc[:, 1:].to_numpy(dtype=np.float64)
 
-    coef, residuals, rank, s = np.linalg.lstsq(X_design, y_clean, rcond=None)
-
-    y_pred = X_design @ coef
-    ss_res = np.sum((y_clean - y_pred) ** 2)
-    ss_tot = np.sum((y_clean - y_clean.mean()) ** 2)
-    r2 = 1 - ss_res / ss_tot if ss_tot > 0 else np.nan
+    coef, r2 = _ols_fit(y_clean, X_clean)
 
     return {
         "intercept": coef[0],
@@ -53,12 +89,49 @@ def run_structural_paths(df: pd.DataFrame) -> None:
         "SAFETY_PERF": ["GTRN", "MAINT", "COMP"],
     }
 
+    # Pull every column the specs need into one float array up front, so each
+    # path model is plain integer indexing instead of pandas slicing + concat.
+    cols = list(dict.fromkeys(
+        col for target, predictors in path_specs.items() for col in (target, *predictors)
+    ))
+    arr = df[cols].to_numpy(dtype=np.float64)
+    col_idx = {col: i for i, col in enumerate(cols)}
+    nan_mask = np.isnan(arr)
+
+    # Targets that share an identical predictor list and the same complete
+    # rows have the same design matrix; fit them together as stacked y columns
+    # so XᵀX is formed and factored once.
+    groups: Dict[Tuple[str, ...], List[str]] = {}
     for target, predictors in path_specs.items():
-        print(f"\n=== Path model: {target} ~ {', '.join(predictors)} ===")
-        y = df[target]
-        X = df[predictors]
+        groups.setdefault(tuple(predictors), []).append(target)
+
+    fits: Dict[str, Dict] = {}
+    for predictors, targets in groups.items():
+        x_idx = [col_idx[p] for p in predictors]
+        x_complete = ~nan_mask[:, x_idx].any(axis=1)
+
+        # Drop rows with NaN in any relevant column
+        by_rows: Dict[bytes, Tuple[np.ndarray, List[str]]] = {}
+        for target in targets:
+            keep = x_complete & ~nan_mask[:, col_idx[target]]
+            by_rows.setdefault(keep.tobytes(), (keep, []))[1].append(target)
 
-        results = _ols_regression(y, X)
+        for keep, same_rows in by_rows.values():
+            Y_clean = arr[keep][:, [col_idx[t] for t in same_rows]]
+            X_clean = arr[keep][:, x_idx]
+            beta, r2 = _ols_fit(Y_clean, X_clean)
+            r2 = np.atleast_1d(r2)
+            for j, target in enumerate(same_rows):
+                fits[target] = {
+                    "intercept": beta[0, j],
+                    "coefficients": dict(zip(predictors, beta[1:, j])),
+                    "r2": r2[j],
+                    "n": len(Y_clean),
+                }
+
+    for target, predictors in path_specs.items():
+        print(f"\n=== Path model: {target} ~ {', '.join(predictors)} ===")
+        results = fits[target]
 
         print(f"n = {results['n']}, R² = {results['r2']:.3f}")
         print("Intercept:", round(results["intercept"], 3))
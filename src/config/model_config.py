@@ -11,8 +11,10 @@ The goal is to keep all SEM/ML "wiring" in one place so that:
 - docs/model_spec.md matches this file
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -33,7 +35,7 @@ class ConstructConfig:
     code: str
     name: str
     description: str
-    indicators: List[str]
+    indicators: Tuple[str, ...]
 
 
 CONSTRUCTS: Dict[str, ConstructConfig] = {
@@ -45,7 +47,7 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
             "Extent to which the company considers environmental criteria "
             "in supplier selection, monitoring and certification."
         ),
-        indicators=["GPUR_1", "GPUR_2", "GPUR_3", "GPUR_4"],
+        indicators=("GPUR_1", "GPUR_2", "GPUR_3", "GPUR_4"),
     ),
     "GOPS": ConstructConfig(
         code="GOPS",
@@ -54,7 +56,7 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
             "Degree to which production and processing operations are "
             "environmentally responsible and resource-efficient."
         ),
-        indicators=["GOPS_1", "GOPS_2", "GOPS_3", "GOPS_4"],
+        indicators=("GOPS_1", "GOPS_2", "GOPS_3", "GOPS_4"),
     ),
     "GLOG": ConstructConfig(
         code="GLOG",
@@ -62,7 +64,7 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
         description=(
             "How green and efficient logistics and transport activities are."
         ),
-        indicators=["GLOG_1", "GLOG_2", "GLOG_3"],
+        indicators=("GLOG_1", "GLOG_2", "GLOG_3"),
     ),
     "GTRN": ConstructConfig(
         code="GTRN",
@@ -71,7 +73,7 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
             "Quality and frequency of environmental and safety-related "
             "training and awareness."
         ),
-        indicators=["GTRN_1", "GTRN_2", "GTRN_3"],
+        indicators=("GTRN_1", "GTRN_2", "GTRN_3"),
     ),
     "GCOL": ConstructConfig(
         code="GCOL",
@@ -80,7 +82,7 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
             "Extent of collaboration with suppliers and customers on "
             "environmental improvement initiatives."
         ),
-        indicators=["GCOL_1", "GCOL_2", "GCOL_3"],
+        indicators=("GCOL_1", "GCOL_2", "GCOL_3"),
     ),
 
     # Mediators --------------------------------------------------------------
@@ -90,7 +92,7 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
         description=(
             "Degree of integration and information sharing with key suppliers."
         ),
-        indicators=["SUPINT_1", "SUPINT_2", "SUPINT_3"],
+        indicators=("SUPINT_1", "SUPINT_2", "SUPINT_3"),
     ),
     "MAINT": ConstructConfig(
         code="MAINT",
@@ -98,7 +100,7 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
         description=(
             "Robustness and effectiveness of the maintenance system."
         ),
-        indicators=["MAINT_1", "MAINT_2", "MAINT_3"],
+        indicators=("MAINT_1", "MAINT_2", "MAINT_3"),
     ),
     "COMP": ConstructConfig(
         code="COMP",
@@ -107,7 +109,7 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
             "Skill level, training and behavioural reliability of employees "
             "in operations."
         ),
-        indicators=["COMP_1", "COMP_2", "COMP_3"],
+        indicators=("COMP_1", "COMP_2", "COMP_3"),
     ),
 
     # Perceived outcomes -----------------------------------------------------
@@ -118,7 +120,7 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
             "Subjective perception of how efficiently operations run "
             "(downtime, resource use, smoothness, cost)."
         ),
-        indicators=["OE_1", "OE_2", "OE_3", "OE_4", "OE_5"],
+        indicators=("OE_1", "OE_2", "OE_3", "OE_4", "OE_5"),
     ),
     "EP": ConstructConfig(
         code="EP",
@@ -127,13 +129,14 @@ CONSTRUCTS: Dict[str, ConstructConfig] = {
             "Subjective perception of overall business performance and "
             "competitiveness."
         ),
-        indicators=["EP_1", "EP_2", "EP_3", "EP_4", "EP_5"],
+        indicators=("EP_1", "EP_2", "EP_3", "EP_4", "EP_5"),
     ),
 }
 
 
-def get_construct_codes() -> List[str]:
-    """Return list of construct codes in a stable order."""
+@lru_cache(maxsize=1)
+def get_construct_codes() -> Tuple[str, ...]:
+    """Return construct codes in a stable order (cached; CONSTRUCTS is constant)."""
     # Order roughly from inputs → mediators → outcomes
     ordered = [
         "GPUR", "GOPS", "GLOG", "GTRN", "GCOL",
@@ -141,22 +144,21 @@ def get_construct_codes() -> List[str]:
         "OE", "EP",
     ]
     # Fallback in case dict changes
-    return [c for c in ordered if c in CONSTRUCTS] + [
+    return tuple([c for c in ordered if c in CONSTRUCTS] + [
         c for c in CONSTRUCTS.keys() if c not in ordered
-    ]
+    ])
 
 
+@lru_cache(maxsize=None)
 def get_construct(code: str) -> ConstructConfig:
     """Get configuration for a single construct code."""
     return CONSTRUCTS[code]
 
 
-def all_indicators() -> List[str]:
-    """Return a flat list of all indicator column names."""
-    cols: List[str] = []
-    for cfg in CONSTRUCTS.values():
-        cols.extend(cfg.indicators)
-    return cols
+@lru_cache(maxsize=1)
+def all_indicators() -> Tuple[str, ...]:
+    """Return all indicator column names, flattened (cached)."""
+    return tuple(ind for cfg in CONSTRUCTS.values() for ind in cfg.indicators)
 
 
 # ---------------------------------------------------------------------------
@@ -192,14 +194,33 @@ STRUCTURAL_PATHS: List[Tuple[str, str]] = [
 ]
 
 
-def get_downstream_targets(source: str) -> List[str]:
+def _build_adjacency(
+    paths: List[Tuple[str, str]],
+) -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]]]:
+    """Return (downstream, upstream) adjacency maps for a list of paths."""
+    downstream: Dict[str, List[str]] = defaultdict(list)
+    upstream: Dict[str, List[str]] = defaultdict(list)
+    for source, target in paths:
+        downstream[source].append(target)
+        upstream[target].append(source)
+    return (
+        {k: tuple(v) for k, v in downstream.items()},
+        {k: tuple(v) for k, v in upstream.items()},
+    )
+
+
+# STRUCTURAL_PATHS is a module constant, so the maps are built once at import
+_DOWNSTREAM, _UPSTREAM = _build_adjacency(STRUCTURAL_PATHS)
+
+
+def get_downstream_targets(source: str) -> Tuple[str, ...]:
     """Return all constructs that the given construct points to."""
-    return [t for s, t in STRUCTURAL_PATHS if s == source]
+    return _DOWNSTREAM.get(source, ())
 
 
-def get_upstream_sources(target: str) -> List[str]:
+def get_upstream_sources(target: str) -> Tuple[str, ...]:
     """Return all constructs that point into the given construct."""
-    return [s for s, t in STRUCTURAL_PATHS if t == target]
+    return _UPSTREAM.get(target, ())
 
 
 # ---------------------------------------------------------------------------
@@ -232,11 +253,14 @@ CORE_KPIS: List[str] = [
     "ltifr",
     "trifr",
     "sifr",
-    "fifr"
+    "fifr",
     "safety_audits_passed_percent",
     "employees_competent_percent",
 ]
 
+# O(1) membership checks for is_core_kpi
+_CORE_KPIS_SET = frozenset(CORE_KPIS)
+
 
 # Optional: informal grouping for reporting / plotting
 KPI_CATEGORIES: Dict[str, List[str]] = {
@@ -271,19 +295,30 @@ KPI_CATEGORIES: Dict[str, List[str]] = {
 
 }
 
+# Reverse index: KPI name -> its category (O(1) lookups for category_of_kpi)
+_KPI_TO_CATEGORY: Dict[str, str] = {
+    kpi: category for category, kpis in KPI_CATEGORIES.items() for kpi in kpis
+}
+
 
 def is_core_kpi(name: str) -> bool:
     """Check if a KPI name is part of the core v1 set."""
-    return name in CORE_KPIS
+    return name in _CORE_KPIS_SET
+
+
+def category_of_kpi(name: str) -> Optional[str]:
+    """Return the category of a KPI, or None if it is not in KPI_CATEGORIES."""
+    return _KPI_TO_CATEGORY.get(name)
 
 
-def list_kpis_by_category(category: str) -> List[str]:
+def list_kpis_by_category(category: str) -> Tuple[str, ...]:
     """Return KPIs for a given category (operational, environmental, etc.)."""
-    return KPI_CATEGORIES.get(category, [])
+    return tuple(KPI_CATEGORIES.get(category, ()))
 
 
-def list_all_kpis() -> List[str]:
-    """Return a flat list of all KPIs known to the config."""
+@lru_cache(maxsize=1)
+def list_all_kpis() -> Tuple[str, ...]:
+    """Return all KPIs known to the config, de-duplicated (cached)."""
     seen = set()
     all_list: List[str] = []
     for group in KPI_CATEGORIES.values():
@@ -291,5 +326,5 @@ def list_all_kpis() -> List[str]:
             if k not in seen:
                 seen.add(k)
                 all_list.append(k)
-    return all_list
+    return tuple(all_list)
 
@@ -3,8 +3,8 @@ Generate realistic synthetic site-level data using a simple
 SEM-inspired generative process (no SDV).
 
 Output:
-    data/outputs/site_level_synthetic.csv  (synthetic sites with
-    constructs, KPIs, OE_HARD, SAFETY_PERF)
+    data/outputs/site_level_synthetic.parquet  (synthetic sites with
+    constructs, KPIs, OE_HARD, SAFETY_PERF; .csv with --format csv)
 
 This does NOT try to learn from the tiny real dataset. Instead it
 encodes plausible mining behaviour:
@@ -21,15 +21,31 @@ encodes plausible mining behaviour:
 
 from __future__ import annotations
 
+import argparse
 import os
+import sys
+from pathlib import Path
 from typing import Tuple, Dict
 
 import numpy as np
 import pandas as pd
 
+try:
+    import numba
+except ImportError:  # numba is optional; the NumPy kernel is used instead
+    numba = None
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-OUTPUT_PATH = os.path.join(BASE_DIR, "data", "outputs", "site_level_synthetic.csv")
+
+BASE_DIR = Path(__file__).resolve().parents[2]          # project root
+_BASE_DIR_STR = str(BASE_DIR)
+
+# Keep `src` importable when run as a script: numba's on-disk cache records
+# the package module name and re-imports it when loading the KPI kernel.
+if _BASE_DIR_STR not in sys.path:
+    sys.path.insert(0, _BASE_DIR_STR)
+
+OUTPUT_PATH = str(BASE_DIR / "data" / "outputs" / "site_level_synthetic.parquet")
+CSV_OUTPUT_PATH = str(Path(OUTPUT_PATH).with_suffix(".csv"))
 
 
 # ---------------------------------------------------------------------
@@ -41,13 +57,215 @@ def _likert_from_z(z: np.ndarray, mean: float = 3.5, scale: float = 0.7) -> np.n
     """
     Map a latent z-score to a 1–5 Likert-style score.
     """
-    x = mean + scale * z
-    return np.clip(x, 1.0, 5.0)
+    x = scale * z
+    x += mean
+    np.clip(x, 1.0, 5.0, out=x)
+    return x
+
+
+def _standardize(x: np.ndarray) -> np.ndarray:
+    """Standardize to z-scores along the last axis (each row of a stack)."""
+    z = x - x.mean(axis=-1, keepdims=True)
+    z /= x.std(axis=-1, ddof=0, keepdims=True)
+    return z
+
+
+# ---------------------------------------------------------------------
+# KPI layer
+# ---------------------------------------------------------------------
+
+# Standardized site-level drivers of the objective KPIs
+_KPI_DRIVERS: Tuple[str, ...] = (
+    "OE_norm",
+    "SAF_norm",
+    "MAINT_norm",
+    "green_factor",
+    "supply_maint_factor",
+)
+
+# kpi: (base, loadings on _KPI_DRIVERS, noise sd, clip low, clip high)
+# Each KPI is base + loadings · drivers + N(0, sd), clipped to [low, high].
+_KPI_SPEC: Dict[str, Tuple[float, Tuple[float, ...], float, float, float]] = {
+    # Operational KPIs --------------------------------------------------
+    # Uptime: higher with OE
+    "uptime_percent": (85.0, (7.0, 0.0, 0.0, 0.0, 0.0), 2.0, 70.0, 99.0),
+    # Unplanned downtime hours: lower with OE
+    "unplanned_downtime_hours": (180.0, (-35.0, 0.0, 0.0, 0.0, 0.0), 10.0, 40.0, 260.0),
+    # Tons per hour: higher with OE
+    "tons_per_hour": (260.0, (45.0, 0.0, 0.0, 0.0, 0.0), 15.0, 150.0, 420.0),
+    # Rework rate: lower with OE and MAINT
+    "rework_rate_percent": (3.0, (-0.5, 0.0, -0.4, 0.0, 0.0), 0.3, 0.2, 6.0),
+    # Energy & water per ton: lower with better GSCM and OE
+    "energy_kwh_per_ton": (52.0, (-1.5, 0.0, 0.0, -3.0, 0.0), 1.5, 38.0, 60.0),
+    "water_m3_per_ton": (1.0, (-0.08, 0.0, 0.0, -0.12, 0.0), 0.05, 0.4, 1.5),
+    # Cost structure: lower costs with OE and SUPINT + MAINT
+    "cost_per_ton": (640.0, (-45.0, 0.0, 0.0, 0.0, -20.0), 20.0, 450.0, 800.0),
+    "maintenance_cost_per_ton": (160.0, (0.0, 0.0, 0.0, 0.0, -25.0), 10.0, 80.0, 260.0),
+    # Supply chain quality
+    "on_time_delivery_percent": (85.0, (0.0, 0.0, 0.0, 0.0, 6.0), 3.0, 60.0, 99.0),
+    "supplier_defect_percent": (3.0, (0.0, 0.0, 0.0, -0.6, -0.4), 0.4, 0.1, 8.0),
+
+    # Safety KPIs -------------------------------------------------------
+    # Base safety frequency ~ 0.5, improved with SAF_norm
+    "ltifr": (0.6, (0.0, -0.12, 0.0, 0.0, 0.0), 0.05, 0.05, 1.2),
+    "trifr": (1.0, (0.0, -0.18, 0.0, 0.0, 0.0), 0.08, 0.1, 2.0),
+    "sifr": (0.4, (0.0, -0.10, 0.0, 0.0, 0.0), 0.04, 0.02, 0.9),
+    "fifr": (0.08, (0.0, -0.03, 0.0, 0.0, 0.0), 0.02, 0.0, 0.2),
+    "safety_audits_passed_percent": (80.0, (0.0, 8.0, 0.0, 0.0, 0.0), 4.0, 50.0, 100.0),
+    "employees_competent_percent": (75.0, (0.0, 7.0, 0.0, 0.0, 0.0), 4.0, 50.0, 100.0),
+    "frontline_stoppages_percent": (30.0, (0.0, -5.0, 0.0, 0.0, 0.0), 3.0, 5.0, 60.0),
+}
+
+# Operational hard index: high uptime, tons, on-time; low downtime, rework, costs, energy, water
+OE_HARD_SIGNS: Dict[str, float] = {
+    "uptime_percent": 1.0,
+    "tons_per_hour": 1.0,
+    "on_time_delivery_percent": 1.0,
+    "unplanned_downtime_hours": -1.0,
+    "rework_rate_percent": -1.0,
+    "energy_kwh_per_ton": -1.0,
+    "water_m3_per_ton": -1.0,
+    "cost_per_ton": -1.0,
+    "maintenance_cost_per_ton": -1.0,
+}
+
+# Safety performance index:
+# high audits & competence, low LTIFR/TRIFR/SIFR/FIFR, low stoppages, low supplier_defect
+SAFETY_PERF_SIGNS: Dict[str, float] = {
+    "safety_audits_passed_percent": 1.0,
+    "employees_competent_percent": 1.0,
+    "ltifr": -1.0,
+    "trifr": -1.0,
+    "sifr": -1.0,
+    "fifr": -1.0,
+    "frontline_stoppages_percent": -1.0,
+    "supplier_defect_percent": -1.0,
+}
+
+KPI_NAMES: Tuple[str, ...] = tuple(_KPI_SPEC)
+
+# Column-wise views of _KPI_SPEC for the kernels
+_KPI_BASE = np.array([spec[0] for spec in _KPI_SPEC.values()])
+_KPI_LOADINGS = np.array([spec[1] for spec in _KPI_SPEC.values()])
+_KPI_NOISE_SD = np.array([spec[2] for spec in _KPI_SPEC.values()])
+_KPI_LOW = np.array([spec[3] for spec in _KPI_SPEC.values()])
+_KPI_HIGH = np.array([spec[4] for spec in _KPI_SPEC.values()])
+
+# Composite = mean of signed, standardized components = weights · Z
+_OE_HARD_WEIGHTS = np.array([OE_HARD_SIGNS.get(k, 0.0) for k in KPI_NAMES]) / len(OE_HARD_SIGNS)
+_SAFETY_PERF_WEIGHTS = (
+    np.array([SAFETY_PERF_SIGNS.get(k, 0.0) for k in KPI_NAMES]) / len(SAFETY_PERF_SIGNS)
+)
+
+
+def _synth_kpis_numpy(
+    drivers: np.ndarray,
+    noise: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    KPI layer and its composite indices.
+
+    drivers holds the _KPI_DRIVERS as rows (n_drivers, n_sites) and noise the
+    standard-normal KPI noise (n_kpis, n_sites). Returns (kpis, OE_HARD,
+    SAFETY_PERF) with kpis shaped (n_kpis, n_sites) in KPI_NAMES order.
+    """
+    kpis = _KPI_LOADINGS @ drivers
+    kpis += _KPI_BASE[:, None]
+    kpis += _KPI_NOISE_SD[:, None] * noise
+    np.clip(kpis, _KPI_LOW[:, None], _KPI_HIGH[:, None], out=kpis)
+
+    Z = _standardize(kpis)
+    return kpis, _OE_HARD_WEIGHTS @ Z, _SAFETY_PERF_WEIGHTS @ Z
+
+
+if numba is not None:
+    @numba.njit(
+        numba.types.Tuple((numba.float64[:, ::1], numba.float64[::1], numba.float64[::1]))(
+            numba.float64[:, ::1], numba.float64[:, ::1],
+            numba.float64[::1], numba.float64[:, ::1], numba.float64[::1],
+            numba.float64[::1], numba.float64[::1],
+            numba.float64[::1], numba.float64[::1],
+        ),
+        cache=True,
+        nogil=True,
+        fastmath={"reassoc", "contract"},
+        # Constant KPIs give NaN composites (as in NumPy) instead of raising
+        error_model="numpy",
+    )
+    def _synth_kpis_jit(drivers, noise, base, loadings, noise_sd, low, high,
+                        oe_weights, safety_weights):
+        """Compiled equivalent of _synth_kpis_numpy: no array temporaries."""
+        n_kpis, n_sites = noise.shape
+        n_drivers = drivers.shape[0]
+
+        kpis = np.empty((n_kpis, n_sites))
+        oe_hard = np.zeros(n_sites)
+        safety_perf = np.zeros(n_sites)
+
+        for k in range(n_kpis):
+            # KPI values and their column mean
+            total = 0.0
+            for i in range(n_sites):
+                x = base[k] + noise_sd[k] * noise[k, i]
+                for d in range(n_drivers):
+                    x += loadings[k, d] * drivers[d, i]
+                x = min(max(x, low[k]), high[k])
+                kpis[k, i] = x
+                total += x
+            mean = total / n_sites
+
+            ss = 0.0
+            for i in range(n_sites):
+                ss += (kpis[k, i] - mean) ** 2
+            std = np.sqrt(ss / n_sites)
+
+            # Accumulate the standardized column into both composites
+            if oe_weights[k] != 0.0 or safety_weights[k] != 0.0:
+                for i in range(n_sites):
+                    z = (kpis[k, i] - mean) / std
+                    oe_hard[i] += oe_weights[k] * z
+                    safety_perf[i] += safety_weights[k] * z
+
+        return kpis, oe_hard, safety_perf
+else:
+    _synth_kpis_jit = None
+
+
+def _synth_kpis(
+    drivers: np.ndarray,
+    noise: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Dispatch to the compiled KPI kernel when numba is available."""
+    if _synth_kpis_jit is None:
+        return _synth_kpis_numpy(drivers, noise)
+    return _synth_kpis_jit(
+        np.ascontiguousarray(drivers, dtype=np.float64),
+        np.ascontiguousarray(noise, dtype=np.float64),
+        _KPI_BASE, _KPI_LOADINGS, _KPI_NOISE_SD, _KPI_LOW, _KPI_HIGH,
+        _OE_HARD_WEIGHTS, _SAFETY_PERF_WEIGHTS,
+    )
 
 
-def _standardize(x: pd.Series) -> pd.Series:
-    """Standardize a series to z-scores."""
-    return (x - x.mean()) / x.std(ddof=0)
+# ---------------------------------------------------------------------
+# Noise channels
+# ---------------------------------------------------------------------
+
+# Rows of the standard-normal noise matrix drawn once per call, shape
+# (_N_NOISE, n_sites): one row per structural error term, then one row per
+# KPI (KPI_NAMES order). Each row is scaled by its sd where it is used.
+_NOISE_GPUR = 0
+_NOISE_GOPS = 1
+_NOISE_GLOG = 2
+_NOISE_GTRN = 3
+_NOISE_GCOL = 4
+_NOISE_SUPINT = 5
+_NOISE_MAINT = 6
+_NOISE_COMP = 7
+_NOISE_OE = 8
+_NOISE_EP = 9
+_NOISE_SAFETY = 10
+_NOISE_KPI = 11          # first of len(KPI_NAMES) KPI rows
+_N_NOISE = _NOISE_KPI + len(KPI_NAMES)
 
 
 # ---------------------------------------------------------------------
@@ -72,25 +290,26 @@ def generate_synthetic_sites(
     # ---------------------------
     # 1) Latent drivers
     # ---------------------------
-    # General "green maturity" factor
-    z_gscm = rng.normal(0.0, 1.0, size=n_sites)
-    # "pressure" factor (regulation + customers)
-    z_pressure = rng.normal(0.0, 1.0, size=n_sites)
-    # management support factor
-    z_mgmt = rng.normal(0.0, 1.0, size=n_sites)
-    # safety culture factor
-    z_safety_culture = rng.normal(0.0, 1.0, size=n_sites)
+    # Independent N(0, 1) factors, drawn in one call (one row per factor):
+    # - z_gscm: general "green maturity" factor
+    # - z_pressure: "pressure" factor (regulation + customers)
+    # - z_mgmt: management support factor
+    # - z_safety_culture: safety culture factor
+    z_gscm, z_pressure, z_mgmt, z_safety_culture = rng.standard_normal((4, n_sites))
+
+    # All remaining Gaussian noise in one draw (rows = _NOISE_* channels)
+    noise = rng.standard_normal((_N_NOISE, n_sites))
 
     # ---------------------------
     # 2) GSCM constructs
     # ---------------------------
     # Use slightly different loadings + noise per construct so they’re
     # correlated but not identical.
-    GPUR_z = 0.6 * z_gscm + 0.3 * z_pressure + rng.normal(0, 0.4, n_sites)
-    GOPS_z = 0.7 * z_gscm + 0.2 * z_mgmt + rng.normal(0, 0.4, n_sites)
-    GLOG_z = 0.6 * z_gscm + 0.3 * z_pressure + rng.normal(0, 0.5, n_sites)
-    GTRN_z = 0.5 * z_gscm + 0.3 * z_mgmt + 0.3 * z_safety_culture + rng.normal(0, 0.4, n_sites)
-    GCOL_z = 0.6 * z_gscm + 0.3 * z_pressure + rng.normal(0, 0.4, n_sites)
+    GPUR_z = 0.6 * z_gscm + 0.3 * z_pressure + 0.4 * noise[_NOISE_GPUR]
+    GOPS_z = 0.7 * z_gscm + 0.2 * z_mgmt + 0.4 * noise[_NOISE_GOPS]
+    GLOG_z = 0.6 * z_gscm + 0.3 * z_pressure + 0.5 * noise[_NOISE_GLOG]
+    GTRN_z = 0.5 * z_gscm + 0.3 * z_mgmt + 0.3 * z_safety_culture + 0.4 * noise[_NOISE_GTRN]
+    GCOL_z = 0.6 * z_gscm + 0.3 * z_pressure + 0.4 * noise[_NOISE_GCOL]
 
     GPUR = _likert_from_z(GPUR_z)
     GOPS = _likert_from_z(GOPS_z)
@@ -101,9 +320,9 @@ def generate_synthetic_sites(
     # ---------------------------
     # 3) Mediators
     # ---------------------------
-    SUPINT_z = 0.5 * GPUR_z + 0.3 * GCOL_z + rng.normal(0, 0.4, n_sites)
-    MAINT_z = 0.5 * GOPS_z + 0.3 * GTRN_z + 0.2 * z_mgmt + rng.normal(0, 0.4, n_sites)
-    COMP_z = 0.6 * GTRN_z + 0.2 * z_mgmt + rng.normal(0, 0.4, n_sites)
+    SUPINT_z = 0.5 * GPUR_z + 0.3 * GCOL_z + 0.4 * noise[_NOISE_SUPINT]
+    MAINT_z = 0.5 * GOPS_z + 0.3 * GTRN_z + 0.2 * z_mgmt + 0.4 * noise[_NOISE_MAINT]
+    COMP_z = 0.6 * GTRN_z + 0.2 * z_mgmt + 0.4 * noise[_NOISE_COMP]
 
     SUPINT = _likert_from_z(SUPINT_z)
     MAINT = _likert_from_z(MAINT_z)
@@ -116,12 +335,12 @@ def generate_synthetic_sites(
         0.5 * MAINT_z
         + 0.3 * COMP_z
         + 0.2 * SUPINT_z
-        + rng.normal(0, 0.3, n_sites)
+        + 0.3 * noise[_NOISE_OE]
     )
     EP_latent = (
         0.6 * OE_latent
         + 0.2 * z_pressure
-        + rng.normal(0, 0.3, n_sites)
+        + 0.3 * noise[_NOISE_EP]
     )
 
     OE = _likert_from_z(OE_latent)
@@ -135,137 +354,27 @@ def generate_synthetic_sites(
         + 0.4 * COMP_z
         + 0.2 * GTRN_z
         + 0.3 * z_safety_culture
-        + rng.normal(0, 0.3, n_sites)
+        + 0.3 * noise[_NOISE_SAFETY]
     )
 
     # ---------------------------
-    # 6) Objective KPIs
+    # 6) Objective and safety KPIs, OE_HARD and SAFETY_PERF indices
     # ---------------------------
-    # Normalize OE_latent and safety_latent for easier scaling
-    OE_norm = (OE_latent - OE_latent.mean()) / OE_latent.std(ddof=0)
-    SAF_norm = (safety_latent - safety_latent.mean()) / safety_latent.std(ddof=0)
-
-    # Uptime: higher with OE
-    uptime_percent = 85 + 7 * OE_norm + rng.normal(0, 2.0, n_sites)
-    uptime_percent = np.clip(uptime_percent, 70, 99)
-
-    # Unplanned downtime hours: lower with OE
-    unplanned_downtime_hours = 180 - 35 * OE_norm + rng.normal(0, 10.0, n_sites)
-    unplanned_downtime_hours = np.clip(unplanned_downtime_hours, 40, 260)
-
-    # Tons per hour: higher with OE
-    tons_per_hour = 260 + 45 * OE_norm + rng.normal(0, 15.0, n_sites)
-    tons_per_hour = np.clip(tons_per_hour, 150, 420)
-
-    # Rework rate: lower with OE and MAINT
-    rework_rate_percent = 3.0 - 0.5 * OE_norm - 0.4 * _standardize(pd.Series(MAINT_z)) \
-        + rng.normal(0, 0.3, n_sites)
-    rework_rate_percent = np.clip(rework_rate_percent, 0.2, 6.0)
-
-    # Energy & water per ton: lower with better GSCM and OE
-    green_factor = _standardize(pd.Series(GPUR_z + GOPS_z + GLOG_z))
-    energy_kwh_per_ton = 52 - 3.0 * green_factor - 1.5 * OE_norm + rng.normal(0, 1.5, n_sites)
-    energy_kwh_per_ton = np.clip(energy_kwh_per_ton, 38, 60)
-
-    water_m3_per_ton = 1.0 - 0.12 * green_factor - 0.08 * OE_norm + rng.normal(0, 0.05, n_sites)
-    water_m3_per_ton = np.clip(water_m3_per_ton, 0.4, 1.5)
-
-    # Cost structure: lower costs with OE and SUPINT + MAINT
-    supply_maint_factor = _standardize(pd.Series(SUPINT_z + MAINT_z))
-    cost_per_ton = 640 - 45 * OE_norm - 20 * supply_maint_factor + rng.normal(0, 20.0, n_sites)
-    cost_per_ton = np.clip(cost_per_ton, 450, 800)
-
-    maintenance_cost_per_ton = 160 - 25 * supply_maint_factor + rng.normal(0, 10.0, n_sites)
-    maintenance_cost_per_ton = np.clip(maintenance_cost_per_ton, 80, 260)
-
-    # Supply chain quality
-    on_time_delivery_percent = 85 + 6 * supply_maint_factor + rng.normal(0, 3.0, n_sites)
-    on_time_delivery_percent = np.clip(on_time_delivery_percent, 60, 99)
-
-    supplier_defect_percent = 3.0 - 0.6 * green_factor - 0.4 * supply_maint_factor + rng.normal(0, 0.4, n_sites)
-    supplier_defect_percent = np.clip(supplier_defect_percent, 0.1, 8.0)
+    # Normalize the drivers (rows in _KPI_DRIVERS order) for easier scaling,
+    # all in one stacked mean/std pass
+    drivers = _standardize(np.stack([
+        OE_latent,
+        safety_latent,
+        MAINT_z,
+        GPUR_z + GOPS_z + GLOG_z,       # green factor
+        SUPINT_z + MAINT_z,             # supply/maintenance factor
+    ]))
+    kpis, OE_HARD, SAFETY_PERF = _synth_kpis(drivers, noise[_NOISE_KPI:])
 
     # ---------------------------
-    # 7) Safety KPIs
+    # 7) Assemble final DataFrame
     # ---------------------------
-    # Base safety frequency ~ 0.5, improved with SAF_norm
-    ltifr = 0.6 - 0.12 * SAF_norm + rng.normal(0, 0.05, n_sites)
-    ltifr = np.clip(ltifr, 0.05, 1.2)
-
-    trifr = 1.0 - 0.18 * SAF_norm + rng.normal(0, 0.08, n_sites)
-    trifr = np.clip(trifr, 0.1, 2.0)
-
-    sifr = 0.4 - 0.10 * SAF_norm + rng.normal(0, 0.04, n_sites)
-    sifr = np.clip(sifr, 0.02, 0.9)
-
-    fifr = 0.08 - 0.03 * SAF_norm + rng.normal(0, 0.02, n_sites)
-    fifr = np.clip(fifr, 0.0, 0.2)
-
-    safety_audits_passed_percent = 80 + 8 * SAF_norm + rng.normal(0, 4.0, n_sites)
-    safety_audits_passed_percent = np.clip(safety_audits_passed_percent, 50, 100)
-
-    employees_competent_percent = 75 + 7 * SAF_norm + rng.normal(0, 4.0, n_sites)
-    employees_competent_percent = np.clip(employees_competent_percent, 50, 100)
-
-    frontline_stoppages_percent = 30 - 5 * SAF_norm + rng.normal(0, 3.0, n_sites)
-    frontline_stoppages_percent = np.clip(frontline_stoppages_percent, 5, 60)
-
-    # ---------------------------
-    # 8) OE_HARD and SAFETY_PERF indices
-    # ---------------------------
-    df_kpi = pd.DataFrame({
-        "uptime_percent": uptime_percent,
-        "unplanned_downtime_hours": unplanned_downtime_hours,
-        "tons_per_hour": tons_per_hour,
-        "rework_rate_percent": rework_rate_percent,
-        "energy_kwh_per_ton": energy_kwh_per_ton,
-        "water_m3_per_ton": water_m3_per_ton,
-        "cost_per_ton": cost_per_ton,
-        "maintenance_cost_per_ton": maintenance_cost_per_ton,
-        "on_time_delivery_percent": on_time_delivery_percent,
-        "supplier_defect_percent": supplier_defect_percent,
-        "ltifr": ltifr,
-        "trifr": trifr,
-        "sifr": sifr,
-        "fifr": fifr,
-        "safety_audits_passed_percent": safety_audits_passed_percent,
-        "employees_competent_percent": employees_competent_percent,
-        "frontline_stoppages_percent": frontline_stoppages_percent,
-    })
-
-    # Operational hard index: high uptime, tons, on-time; low downtime, rework, costs, energy, water
-    oe_components = pd.DataFrame({
-        "uptime": _standardize(df_kpi["uptime_percent"]),
-        "tons": _standardize(df_kpi["tons_per_hour"]),
-        "on_time": _standardize(df_kpi["on_time_delivery_percent"]),
-        "downtime": -_standardize(df_kpi["unplanned_downtime_hours"]),
-        "rework": -_standardize(df_kpi["rework_rate_percent"]),
-        "energy": -_standardize(df_kpi["energy_kwh_per_ton"]),
-        "water": -_standardize(df_kpi["water_m3_per_ton"]),
-        "cost": -_standardize(df_kpi["cost_per_ton"]),
-        "maint_cost": -_standardize(df_kpi["maintenance_cost_per_ton"]),
-    })
-    OE_HARD = oe_components.mean(axis=1)
-
-    # Safety performance index:
-    # high audits & competence, low LTIFR/TRIFR/SIFR/FIFR, low stoppages, low supplier_defect
-    safety_components = pd.DataFrame({
-        "audits": _standardize(df_kpi["safety_audits_passed_percent"]),
-        "competence": _standardize(df_kpi["employees_competent_percent"]),
-        "ltifr": -_standardize(df_kpi["ltifr"]),
-        "trifr": -_standardize(df_kpi["trifr"]),
-        "sifr": -_standardize(df_kpi["sifr"]),
-        "fifr": -_standardize(df_kpi["fifr"]),
-        "stoppages": -_standardize(df_kpi["frontline_stoppages_percent"]),
-        "sup_defects": -_standardize(df_kpi["supplier_defect_percent"]),
-    })
-    SAFETY_PERF = safety_components.mean(axis=1)
-
-    # ---------------------------
-    # 9) Assemble final DataFrame
-    # ---------------------------
-    df_constructs = pd.DataFrame({
-        "site_id": [f"SYN_{i+1:03d}" for i in range(n_sites)],
+    columns: Dict[str, np.ndarray] = {
         "GPUR": GPUR,
         "GOPS": GOPS,
         "GLOG": GLOG,
@@ -276,26 +385,59 @@ def generate_synthetic_sites(
         "COMP": COMP,
         "OE": OE,
         "EP": EP,
-    })
+        **dict(zip(KPI_NAMES, kpis)),
+        "OE_HARD": OE_HARD,
+        "SAFETY_PERF": SAFETY_PERF,
+    }
 
-    df_all = pd.concat([df_constructs, df_kpi], axis=1)
-    df_all["OE_HARD"] = OE_HARD
-    df_all["SAFETY_PERF"] = SAFETY_PERF
+    # One contiguous float64 block -> single DataFrame construction
+    data = np.empty((n_sites, len(columns)), dtype=np.float64)
+    for j, values in enumerate(columns.values()):
+        data[:, j] = values
+
+    df_all = pd.DataFrame(data, columns=list(columns))
+    df_all.insert(0, "site_id", [f"SYN_{i+1:03d}" for i in range(n_sites)])
 
     return df_all
 
 
-def main(n_samples: int = 100, random_seed: int = 42) -> None:
+def main(n_samples: int = 100, random_seed: int = 42, fmt: str = "parquet") -> None:
+    if fmt not in ("parquet", "csv"):
+        raise ValueError(f"Unknown output format: {fmt}")
+
     print(f"Generating {n_samples} synthetic sites (realistic model)...")
     df = generate_synthetic_sites(n_sites=n_samples, random_seed=random_seed)
 
     os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-    df.to_csv(OUTPUT_PATH, index=False)
-
-    print(f"Synthetic dataset saved to: {OUTPUT_PATH}")
+    output_path = OUTPUT_PATH
+    if fmt == "parquet":
+        try:
+            df.to_parquet(OUTPUT_PATH, engine="pyarrow", compression="zstd", index=False)
+        except ImportError:
+            print("pyarrow is not installed; writing CSV instead.")
+            fmt = "csv"
+    if fmt == "csv":
+        output_path = CSV_OUTPUT_PATH
+        df.to_csv(output_path, index=False)
+
+    print(f"Synthetic dataset saved to: {output_path}")
     print("\n--- Synthetic Head ---")
     print(df.head())
 
 
 if __name__ == "__main__":
-    main(n_samples=100, random_seed=42)
+    parser = argparse.ArgumentParser(description="Generate synthetic site-level data.")
+    parser.add_argument(
+        "--format",
+        choices=("parquet", "csv"),
+        default="parquet",
+        help="Output file format (default: parquet).",
+    )
+    parser.add_argument(
+        "--csv",
+        dest="format",
+        action="store_const",
+        const="csv",
+        help="Shorthand for --format csv.",
+    )
+    main(n_samples=100, random_seed=42, fmt=parser.parse_args().format)
@@ -3,13 +3,14 @@ Generate realistic synthetic respondent-level survey data based on
 site-level construct scores.
 
 Input:
-    data/outputs/site_level_synthetic.csv
+    data/outputs/site_level_synthetic.parquet (or .csv)
         - One row per site (site_id)
         - Columns include the latent constructs defined in CONSTRUCTS
           (e.g., GPUR, GOPS, GLOG, GTRN, GCOL, SUPINT, MAINT, COMP, OE, EP)
 
 Output:
-    data/outputs/survey_synthetic.csv
+    data/outputs/survey_synthetic.parquet (.csv with --format csv / --csv;
+    --batches N generates and writes it N site batches at a time)
         - Multiple rows per site (respondents_per_site each)
         - Columns:
             respondent_id, site_id, company_id,
@@ -31,50 +32,240 @@ This makes:
 
 from __future__ import annotations
 
+import argparse
 import os
 import sys
-from typing import Dict, List
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    import numba
+except ImportError:  # numba is optional; the NumPy path is used instead
+    numba = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_pq
+except ImportError:  # pyarrow is optional; CSV output falls back to pandas
+    pa = None
+
 # -------------------------------------------------------------------
-# Path setup so we can import src.config.model_config
+# Path setup so we can import src.config.model_config (and so numba's
+# on-disk cache, which re-imports this module by name, can find `src`)
 # -------------------------------------------------------------------
-THIS_FILE = os.path.abspath(__file__)
-DATA_GEN_DIR = os.path.dirname(THIS_FILE)                  # .../src/data_generation
-SRC_DIR = os.path.dirname(DATA_GEN_DIR)                    # .../src
-PROJECT_ROOT = os.path.dirname(SRC_DIR)                    # project root
+PROJECT_ROOT = Path(__file__).resolve().parents[2]      # .../src/data_generation -> root
+_PROJECT_ROOT_STR = str(PROJECT_ROOT)
 
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+if _PROJECT_ROOT_STR not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT_STR)
 
-from src.config.model_config import CONSTRUCTS  # noqa: E402
+from src.config.model_config import CONSTRUCTS, LIKERT_MAX, LIKERT_MIN  # noqa: E402
+from src.data_ingestion.loader import load_site_level_table, table_source  # noqa: E402
 
 
-SITE_LEVEL_PATH = os.path.join(
-    PROJECT_ROOT, "data", "outputs", "site_level_synthetic.csv"
-)
-OUTPUT_PATH = os.path.join(
-    PROJECT_ROOT, "data", "outputs", "survey_synthetic.csv"
+SITE_LEVEL_PATH = str(PROJECT_ROOT / "data" / "outputs" / "site_level_synthetic.csv")
+OUTPUT_PATH = str(PROJECT_ROOT / "data" / "outputs" / "survey_synthetic.parquet")
+CSV_OUTPUT_PATH = str(Path(OUTPUT_PATH).with_suffix(".csv"))
+
+# Rows converted and written per chunk when streaming the CSV output
+CSV_CHUNK_ROWS = 65_536
+
+# Indicator columns in config order, with the position of their construct
+_CONSTRUCT_CODES: List[str] = list(CONSTRUCTS.keys())
+_INDICATOR_COLS: List[str] = [
+    ind for code in _CONSTRUCT_CODES for ind in CONSTRUCTS[code].indicators
+]
+_IND_TO_C = np.asarray(
+    [ci for ci, code in enumerate(_CONSTRUCT_CODES) for _ in CONSTRUCTS[code].indicators],
+    dtype=np.intp,
 )
 
 
-def _likert_from_latent(
+def _quantize_likert(arr: np.ndarray) -> np.ndarray:
+    """
+    Round item values to Likert integers in [LIKERT_MIN, LIKERT_MAX].
+
+    Rounds and clips the float array arr in place (no temporaries) and
+    returns the result as a new int8 array of the same shape.
+    """
+    np.rint(arr, out=arr)
+    np.clip(arr, LIKERT_MIN, LIKERT_MAX, out=arr)
+    return arr.astype(np.int8)
+
+
+def _draw_site_batch(
+    latent: np.ndarray,
+    noise: np.ndarray,
+    site_means: np.ndarray,
+    latent_sigma: float,
     rng: np.random.Generator,
-    latent_value: float,
-    indicator_sigma: float = 0.5,
-) -> int:
+) -> None:
+    """
+    Fill the respondent latents and item noise for a batch of sites in place.
+
+    latent is (n_sites, n_resp, n_constructs) and becomes site_means plus
+    N(0, latent_sigma), clipped to 1..5; noise (n_sites, n_resp, n_items)
+    is filled with standard normals. Both are drawn from rng in that order.
+    """
+    rng.standard_normal(out=latent)
+    latent *= latent_sigma
+    latent += site_means[:, None, :]
+    np.clip(latent, 1.0, 5.0, out=latent)
+    rng.standard_normal(out=noise)
+
+
+def _likert_items_numpy(
+    latent: np.ndarray,
+    noise: np.ndarray,
+    ind_to_c: np.ndarray,
+    indicator_sigma: float,
+) -> np.ndarray:
+    """
+    Likert item block from respondent latents and standard-normal item noise.
+
+    latent is (n_sites, n_resp, n_constructs), noise (n_sites, n_resp,
+    n_items) and ind_to_c maps each item to its construct. noise is scaled
+    in place. Returns an int8 array of shape (n_sites * n_resp, n_items).
+    """
+    n_sites, n_resp, n_items = noise.shape
+    items = noise
+    items *= indicator_sigma
+    items += latent[:, :, ind_to_c]
+    return _quantize_likert(items).reshape(n_sites * n_resp, n_items)
+
+
+if numba is not None:
+    @numba.njit(
+        numba.int8[:, ::1](
+            numba.float64[:, :, ::1], numba.float64[:, :, ::1],
+            numba.intp[::1], numba.float64,
+        ),
+        cache=True,
+        nogil=True,
+        parallel=True,
+        # No fastmath: fusing sigma * noise + latent into an FMA could move
+        # values across a .5 rounding boundary relative to the NumPy path
+    )
+    def _likert_items_jit(latent, noise, ind_to_c, indicator_sigma):
+        """Fused equivalent of _likert_items_numpy: one pass, int8 output."""
+        n_sites, n_resp, n_items = noise.shape
+        out = np.empty((n_sites * n_resp, n_items), dtype=np.int8)
+        for s in numba.prange(n_sites):
+            for r in range(n_resp):
+                row = s * n_resp + r
+                for j in range(n_items):
+                    v = np.rint(indicator_sigma * noise[s, r, j] + latent[s, r, ind_to_c[j]])
+                    out[row, j] = min(max(v, LIKERT_MIN), LIKERT_MAX)
+        return out
+else:
+    _likert_items_jit = None
+
+
+def _likert_items(
+    latent: np.ndarray,
+    noise: np.ndarray,
+    ind_to_c: np.ndarray,
+    indicator_sigma: float,
+) -> np.ndarray:
+    """Dispatch to the compiled Likert kernel when numba is available."""
+    if _likert_items_jit is None:
+        return _likert_items_numpy(latent, noise, ind_to_c, indicator_sigma)
+    return _likert_items_jit(
+        np.ascontiguousarray(latent, dtype=np.float64),
+        np.ascontiguousarray(noise, dtype=np.float64),
+        np.ascontiguousarray(ind_to_c, dtype=np.intp),
+        float(indicator_sigma),
+    )
+
+
+def _load_sites(rng: np.random.Generator) -> Tuple[pd.DataFrame, np.ndarray]:
     """
-    Given a latent construct value (~1..5), generate a Likert item.
+    Load the site table and its construct scores, shape (n_sites, n_constructs).
 
-    - Add normal noise with std = indicator_sigma
-    - Clip to [1, 5]
-    - Round to nearest integer
+    Missing construct scores are filled from rng with a plausible mid-high
+    Likert value.
     """
-    val = latent_value + rng.normal(loc=0.0, scale=indicator_sigma)
-    val = float(np.clip(val, 1.0, 5.0))
-    return int(np.rint(val))
+    # Only the ID columns and the construct scores are needed; skip the KPI
+    # columns (company_id and missing constructs are skipped if absent)
+    try:
+        site_df = load_site_level_table(
+            SITE_LEVEL_PATH, columns=["site_id", "company_id", *CONSTRUCTS.keys()]
+        )
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Site-level synthetic data not found at:\n  {SITE_LEVEL_PATH}\n"
+            "Run your site-level synthetic generation first "
+            "(e.g., scripts/generate_site_level_synthetic.py)."
+        ) from None
+
+    if "site_id" not in site_df.columns:
+        raise ValueError(
+            "Expected 'site_id' column in site-level synthetic data, "
+            "but it was not found."
+        )
+
+    site_means = site_df.reindex(columns=_CONSTRUCT_CODES).to_numpy(dtype=np.float64)
+    missing = ~np.isfinite(site_means)
+    if missing.any():
+        # Fallback: pick a plausible "mid-high" Likert region
+        site_means[missing] = rng.uniform(2.5, 4.0, size=int(missing.sum()))
+
+    return site_df, site_means
+
+
+def _site_batches(n_sites: int, n_batches: int) -> List[slice]:
+    """Split range(n_sites) into at most n_batches contiguous, non-empty slices."""
+    bounds = np.linspace(0, n_sites, max(n_batches, 1) + 1).astype(int)
+    return [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def _survey_frame(
+    likert: np.ndarray,
+    site_df: pd.DataFrame,
+    sites: slice,
+    n_resp: int,
+) -> pd.DataFrame:
+    """
+    Respondent-level frame for the given slice of site_df's sites.
+
+    likert holds those sites' int8 items (rows = respondents, site-major).
+    The categorical ID columns always carry the categories of all sites, so
+    frames of different site batches concatenate to the full survey.
+    """
+    site_id_values = site_df["site_id"].to_numpy().astype(str)
+    # Categorical ID columns: integer codes per row instead of repeated strings
+    site_codes, site_categories = pd.factorize(site_id_values)
+    site_ids = pd.Categorical.from_codes(
+        np.repeat(site_codes[sites], n_resp), site_categories
+    )
+
+    # respondent_id = "<site_id>_R<k>": broadcast the site ids against the
+    # n_resp suffixes in C rather than formatting every row in Python
+    suffixes = np.char.add("_R", np.arange(1, n_resp + 1).astype(str))
+    respondent_ids = np.char.add(site_id_values[sites, None], suffixes).ravel()
+
+    # Wrap the block as a single int8 column block (no per-column copies),
+    # then prepend the ID columns
+    df = pd.DataFrame(likert, columns=_INDICATOR_COLS, copy=False)
+    # company_id from the site table when it has one; otherwise a simple
+    # placeholder (can later be replaced with a real mapping)
+    if "company_id" in site_df.columns:
+        company_codes, company_categories = pd.factorize(site_df["company_id"])
+        company_ids = pd.Categorical.from_codes(
+            np.repeat(company_codes[sites], n_resp), company_categories
+        )
+    else:
+        company_ids = pd.Categorical.from_codes(
+            np.zeros(len(df), dtype=np.int8), ["SyntheticCo"]
+        )
+    df.insert(0, "company_id", company_ids)
+    df.insert(0, "site_id", site_ids)
+    df.insert(0, "respondent_id", respondent_ids)
+    return df
 
 
 def generate_synthetic_survey(
@@ -82,6 +273,7 @@ def generate_synthetic_survey(
     latent_sigma: float = 0.4,
     indicator_sigma: float = 0.5,
     random_seed: int = 42,
+    n_batches: int = 1,
 ) -> pd.DataFrame:
     """
     Generate respondent-level synthetic survey data.
@@ -96,99 +288,236 @@ def generate_synthetic_survey(
             Standard deviation of indicator-level noise around the latent score.
         random_seed:
             RNG seed for reproducibility.
+        n_batches:
+            Number of site batches whose random draws run as parallel
+            dask.delayed tasks (serially without dask). With the default of
+            1 all sites share one RNG stream; otherwise each batch draws from
+            its own child seed, so the output is reproducible for a given
+            (random_seed, n_batches) but differs from n_batches=1. Only worth
+            it for very large surveys (~1e8 item draws).
 
     Returns:
         DataFrame with columns:
             respondent_id, site_id, company_id, and all indicator columns.
     """
     rng = np.random.default_rng(random_seed)
+    site_df, site_means = _load_sites(rng)
+
+    n_sites = len(site_df)
+    n_resp = respondents_per_site
+
+    # Respondent-specific latent scores around the site means,
+    # shape (n_sites, n_resp, n_constructs), and standard-normal indicator
+    # noise, shape (n_sites, n_resp, n_indicators). Both are filled in place
+    # by bulk draws, one site batch at a time.
+    latent = np.empty((n_sites, n_resp, len(_CONSTRUCT_CODES)))
+    noise = np.empty((n_sites, n_resp, len(_INDICATOR_COLS)))
+    if n_batches <= 1:
+        _draw_site_batch(latent, noise, site_means, latent_sigma, rng)
+    else:
+        batches = _site_batches(n_sites, n_batches)
+        seeds = np.random.SeedSequence(random_seed).spawn(len(batches))
+        args = [
+            (latent[b], noise[b], site_means[b], latent_sigma, np.random.default_rng(seed))
+            for b, seed in zip(batches, seeds)
+        ]
+        try:
+            import dask
+        except ImportError:  # dask is optional; site batches then run serially
+            dask = None
+
+        # The draws release the GIL, so threads fill disjoint slices in
+        # parallel (threads, not processes: the slices are views into latent
+        # and noise)
+        if dask is not None:
+            dask.compute(
+                *[dask.delayed(_draw_site_batch)(*a) for a in args], scheduler="threads"
+            )
+        else:
+            for a in args:
+                _draw_site_batch(*a)
+
+    # Indicators: own construct's latent + noise, rounded/clamped to Likert 1..5.
+    # Likert block: one int8 array (rows = respondents, site-major)
+    likert = _likert_items(latent, noise, _IND_TO_C, indicator_sigma)
+    return _survey_frame(likert, site_df, slice(None), n_resp)
+
+
+def iter_synthetic_survey(
+    respondents_per_site: int = 8,
+    latent_sigma: float = 0.4,
+    indicator_sigma: float = 0.5,
+    random_seed: int = 42,
+    n_batches: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Generate the synthetic survey one site batch at a time.
 
-    if not os.path.exists(SITE_LEVEL_PATH):
-        raise FileNotFoundError(
-            f"Site-level synthetic data not found at:\n  {SITE_LEVEL_PATH}\n"
-            "Run your site-level synthetic generation first "
-            "(e.g., scripts/generate_site_level_synthetic.py)."
-        )
-
-    site_df = pd.read_csv(SITE_LEVEL_PATH)
-
-    if "site_id" not in site_df.columns:
-        raise ValueError(
-            "Expected 'site_id' column in site-level synthetic data, "
-            "but it was not found."
-        )
+    Takes the same arguments as generate_synthetic_survey and yields one
+    respondent-level DataFrame per site batch; concatenated, they equal
+    generate_synthetic_survey(...) with the same n_batches. Only one batch
+    is held in memory at a time, so large surveys can be written out
+    without ever building the full table.
+    """
+    rng = np.random.default_rng(random_seed)
+    site_df, site_means = _load_sites(rng)
+    n_resp = respondents_per_site
+
+    batches = _site_batches(len(site_df), n_batches)
+    if n_batches <= 1:
+        rngs = [rng]
+    else:
+        seeds = np.random.SeedSequence(random_seed).spawn(len(batches))
+        rngs = [np.random.default_rng(seed) for seed in seeds]
+
+    for sites, batch_rng in zip(batches, rngs):
+        n_batch_sites = sites.stop - sites.start
+        latent = np.empty((n_batch_sites, n_resp, len(_CONSTRUCT_CODES)))
+        noise = np.empty((n_batch_sites, n_resp, len(_INDICATOR_COLS)))
+        _draw_site_batch(latent, noise, site_means[sites], latent_sigma, batch_rng)
+        likert = _likert_items(latent, noise, _IND_TO_C, indicator_sigma)
+        yield _survey_frame(likert, site_df, sites, n_resp)
+
+
+def _write_csv(
+    frames: Iterable[pd.DataFrame],
+    path: str,
+    chunk_rows: int = CSV_CHUNK_ROWS,
+) -> None:
+    """
+    Stream survey frames to one CSV file, chunk_rows rows at a time.
 
-    rows: List[Dict] = []
-
-    # Iterate over each synthetic site
-    for _, site_row in site_df.iterrows():
-        site_id = site_row["site_id"]
-        # Simple placeholder company_id; can later be replaced with real mapping.
-        company_id = site_row.get("company_id", "SyntheticCo")
-
-        for r in range(respondents_per_site):
-            respondent_id = f"{site_id}_R{r+1}"
-            row: Dict = {
-                "respondent_id": respondent_id,
-                "site_id": site_id,
-                "company_id": company_id,
-            }
-
-            # For every construct in the config, generate indicators
-            for code, cfg in CONSTRUCTS.items():
-                # Try to pull site-level construct score; if missing, draw fallback
-                site_construct_score = site_row.get(code, np.nan)
-
-                if not np.isfinite(site_construct_score):
-                    # Fallback: pick a plausible "mid-high" Likert region
-                    site_construct_score = rng.uniform(2.5, 4.0)
-
-                # Respondent-specific latent score around the site mean
-                latent_resp = site_construct_score + rng.normal(
-                    loc=0.0, scale=latent_sigma
+    Uses pyarrow's CSV writer (header written once, each chunk converted
+    to Arrow just before it is written, so no second full-size copy of the
+    table is built). Falls back to pandas' chunked to_csv without pyarrow.
+    """
+    if pa is None:
+        for i, df in enumerate(frames):
+            df.to_csv(
+                path, index=False, chunksize=chunk_rows,
+                mode="w" if i == 0 else "a", header=i == 0,
+            )
+        return
+
+    writer = None
+    try:
+        for df in frames:
+            schema = pa.Schema.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pa_csv.CSVWriter(path, schema)
+            for start in range(0, len(df), chunk_rows):
+                chunk = df.iloc[start:start + chunk_rows]
+                writer.write_table(
+                    pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
                 )
-                latent_resp = float(np.clip(latent_resp, 1.0, 5.0))
-
-                # Generate indicators for this construct
-                for ind in cfg.indicators:
-                    row[ind] = _likert_from_latent(
-                        rng,
-                        latent_resp,
-                        indicator_sigma=indicator_sigma,
-                    )
-
-            rows.append(row)
-
-    df = pd.DataFrame(rows)
-    return df
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _write_parquet(frames: Iterable[pd.DataFrame], path: str) -> None:
+    """Write survey frames to one zstd Parquet file, one row group per frame."""
+    writer = None
+    try:
+        for df in frames:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pa_pq.ParquetWriter(path, table.schema, compression="zstd")
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def main(fmt: str = "parquet", n_batches: int = 1) -> None:
+    """
+    Generate the synthetic survey and write it to OUTPUT_PATH (Parquet) or
+    CSV_OUTPUT_PATH (CSV).
 
+    With n_batches > 1 the survey is generated and written one site batch at
+    a time (see iter_synthetic_survey), so peak memory is about one batch
+    instead of the whole table; the draws then differ from n_batches=1 as
+    described in generate_synthetic_survey.
+    """
+    if fmt not in ("parquet", "csv"):
+        raise ValueError(f"Unknown output format: {fmt}")
+    if fmt == "parquet" and pa is None:
+        print("pyarrow is not installed; writing CSV instead.")
+        fmt = "csv"
 
-def main() -> None:
     print(f"Project root: {PROJECT_ROOT}")
-    print(f"Loading site-level data from: {SITE_LEVEL_PATH}")
+    print(f"Loading site-level data from: {table_source(SITE_LEVEL_PATH)}")
 
-    df = generate_synthetic_survey(
+    frames = iter_synthetic_survey(
         respondents_per_site=8,
         latent_sigma=0.4,
         indicator_sigma=0.5,
         random_seed=42,
+        n_batches=n_batches,
     )
 
-    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-    df.to_csv(OUTPUT_PATH, index=False)
+    # Summaries are accumulated per batch, as the full table may never exist
+    head: List[pd.DataFrame] = []
+    gpur_cols = [c for c in _INDICATOR_COLS if c.startswith("GPUR_")]
+    n_rows = 0
+    gpur_sum = np.zeros(len(gpur_cols))
+    gpur_sumsq = np.zeros(len(gpur_cols))
+
+    def summarized(frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        nonlocal n_rows, gpur_sum, gpur_sumsq
+        for df in frames:
+            if not head:
+                head.append(df.head())
+            n_rows += len(df)
+            values = df[gpur_cols].to_numpy(dtype=np.float64)
+            gpur_sum += values.sum(axis=0)
+            gpur_sumsq += (values * values).sum(axis=0)
+            yield df
 
-    print(f"Synthetic survey saved to: {OUTPUT_PATH}")
-    print(f"\nNumber of rows (respondents): {len(df)}")
-    print(f"Number of columns: {len(df.columns)}")
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    if fmt == "parquet":
+        output_path = OUTPUT_PATH
+        _write_parquet(summarized(frames), output_path)
+    else:
+        output_path = CSV_OUTPUT_PATH
+        _write_csv(summarized(frames), output_path)
+
+    print(f"Synthetic survey saved to: {output_path}")
+    print(f"\nNumber of rows (respondents): {n_rows}")
+    print(f"Number of columns: {3 + len(_INDICATOR_COLS)}")
     print("\n--- Survey head ---")
-    print(df.head())
+    print(head[0] if head else pd.DataFrame())
 
     # Quick sanity check: variance of one construct's indicators
-    gpur_cols = [c for c in df.columns if c.startswith("GPUR_")]
-    if gpur_cols:
+    if gpur_cols and n_rows > 1:
+        gpur_var = (gpur_sumsq - gpur_sum * gpur_sum / n_rows) / (n_rows - 1)
         print("\nGPUR indicator variances (sanity check):")
-        print(df[gpur_cols].var())
+        print(pd.Series(gpur_var, index=gpur_cols))
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate synthetic survey data.")
+    parser.add_argument(
+        "--format",
+        choices=("parquet", "csv"),
+        default="parquet",
+        help="Output file format (default: parquet).",
+    )
+    parser.add_argument(
+        "--csv",
+        dest="format",
+        action="store_const",
+        const="csv",
+        help="Shorthand for --format csv.",
+    )
+    parser.add_argument(
+        "--batches",
+        type=int,
+        default=1,
+        help=(
+            "Generate and write the survey in this many site batches to cap "
+            "peak memory (default: 1, the whole survey at once)."
+        ),
+    )
+    args = parser.parse_args()
+    main(fmt=args.format, n_batches=args.batches)
@@ -12,8 +12,10 @@ This module relies on model configuration from src.config.model_config.
 
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from src.config.model_config import CONSTRUCTS, get_construct_codes, all_indicators
@@ -21,6 +23,33 @@ from src.config.model_config import CONSTRUCTS, get_construct_codes, all_indicat
 
 SITE_ID_COL = "site_id"
 
+# Config-derived lookups, built once at import (CONSTRUCTS is constant)
+_ALL_INDICATORS: Tuple[str, ...] = all_indicators()
+_ALL_INDICATORS_SET: FrozenSet[str] = frozenset(_ALL_INDICATORS)
+_CONSTRUCT_INDICATORS: Dict[str, Tuple[str, ...]] = {
+    code: CONSTRUCTS[code].indicators for code in get_construct_codes()
+}
+_CONSTRUCT_CODES: Tuple[str, ...] = tuple(_CONSTRUCT_INDICATORS)
+
+# Score columns are the construct codes plus site_id, so they are unique as
+# long as the codes are; check that once here instead of on every call.
+if (
+    len(set(get_construct_codes())) != len(get_construct_codes())
+    or SITE_ID_COL in _CONSTRUCT_CODES
+):
+    raise ValueError(
+        f"Construct codes must be unique and not '{SITE_ID_COL}': "
+        f"{list(get_construct_codes())}"
+    )
+
+# Indicator -> construct membership matrix, shape (n_indicators, n_constructs):
+# W[i, c] = 1 if indicator i (in _ALL_INDICATORS order) belongs to construct c.
+_MEMBERSHIP = np.zeros((len(_ALL_INDICATORS), len(_CONSTRUCT_CODES)), dtype=np.float32)
+for _c, _code in enumerate(_CONSTRUCT_CODES):
+    for _ind in _CONSTRUCT_INDICATORS[_code]:
+        _MEMBERSHIP[_ALL_INDICATORS.index(_ind), _c] = 1.0
+del _c, _code, _ind
+
 
 def validate_survey_columns(df: pd.DataFrame) -> None:
     """
@@ -30,23 +59,56 @@ def validate_survey_columns(df: pd.DataFrame) -> None:
     Raises:
         ValueError if required columns are missing.
     """
-    missing: List[str] = []
+    # all indicator columns from config must be present (one set difference)
+    missing: List[str] = list(_ALL_INDICATORS_SET.difference(df.columns))
 
     # site_id must be present
     if SITE_ID_COL not in df.columns:
         missing.append(SITE_ID_COL)
 
-    # all indicator columns from config must be present
-    for col in all_indicators():
-        if col not in df.columns:
-            missing.append(col)
-
     if missing:
         raise ValueError(
             f"Survey DataFrame is missing required columns: {sorted(set(missing))}"
         )
 
 
+def _group_means(codes: np.ndarray, n_groups: int, X: np.ndarray) -> np.ndarray:
+    """
+    Column means of X per group, skipping NaNs (like groupby().mean()),
+    returned in X's dtype.
+
+    codes holds the group (0..n_groups-1, numbered in order of first
+    appearance) of each row of X. When every group is one contiguous run of
+    rows (the usual survey layout), all columns are summed with a single
+    np.add.reduceat; otherwise each column is summed with np.bincount.
+    """
+    finite = np.isfinite(X)
+    all_finite = bool(finite.all())
+    values = X if all_finite else np.where(finite, X, 0.0)
+
+    run_starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    if n_groups > 0 and len(run_starts) == n_groups:
+        # Runs appear in code order, so row g of the reduction is group g
+        sums = np.add.reduceat(values, run_starts, axis=0)
+        if all_finite:
+            counts = np.diff(np.r_[run_starts, len(codes)])[:, None]
+        else:
+            counts = np.add.reduceat(finite, run_starts, axis=0, dtype=np.intp)
+    else:
+        sums = np.empty((n_groups, X.shape[1]))
+        if all_finite:
+            counts = np.bincount(codes, minlength=n_groups)[:, None]
+        else:
+            counts = np.empty((n_groups, X.shape[1]))
+        for j in range(X.shape[1]):
+            sums[:, j] = np.bincount(codes, weights=values[:, j], minlength=n_groups)
+            if not all_finite:
+                counts[:, j] = np.bincount(codes, weights=finite[:, j], minlength=n_groups)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (sums / counts).astype(X.dtype, copy=False)
+
+
 def compute_indicator_means_per_site(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate respondent-level survey data to site-level indicator means.
@@ -55,56 +117,93 @@ def compute_indicator_means_per_site(df: pd.DataFrame) -> pd.DataFrame:
         df: DataFrame with one row per respondent, including site_id and all indicators.
 
     Returns:
-        DataFrame with one row per site_id and one column per indicator (mean value).
+        DataFrame with one row per site_id (in order of first appearance) and
+        one float64 column per indicator (mean value).
     """
     # Ensure required columns exist
     validate_survey_columns(df)
 
-    # Group by site_id and compute the mean of all numeric columns (Likert items).
-    grouped = (
-        df.groupby(SITE_ID_COL)
-        .mean(numeric_only=True)
-        .reset_index()
+    # Average only the indicator columns (validation guarantees they all
+    # exist) per site, on integer site codes. Sites keep their order of first
+    # appearance; rows without a site_id are dropped, as in groupby.
+    # Likert answers and their means (1..5) fit comfortably in float32, which
+    # halves the bytes moved by this and the construct-score step.
+    codes, sites = pd.factorize(df[SITE_ID_COL], sort=False)
+    X = df[list(_ALL_INDICATORS)].to_numpy(dtype=np.float32)
+    has_site = codes >= 0
+    if not has_site.all():
+        codes, X = codes[has_site], X[has_site]
+
+    # Returned as float64 so callers see the same dtypes as groupby().mean()
+    grouped = pd.DataFrame(
+        _group_means(codes, len(sites), X).astype(np.float64),
+        columns=list(_ALL_INDICATORS),
     )
+    grouped.insert(0, SITE_ID_COL, sites)
+
+    return grouped
 
-    # Keep only site_id + indicator columns (ignore other numeric fields, if any)
-    indicator_cols: List[str] = all_indicators()
-    cols_to_keep = [SITE_ID_COL] + [c for c in indicator_cols if c in grouped.columns]
 
-    return grouped[cols_to_keep]
+@lru_cache(maxsize=32)
+def _score_layout(
+    columns: Tuple[str, ...],
+) -> Tuple[np.ndarray, np.ndarray, Tuple[str, ...]]:
+    """
+    Resolve which indicators and constructs can be scored from a column set.
+
+    Returns (positions, membership, codes): the positions in columns of the
+    configured indicators that are present (config order), the matching rows
+    of _MEMBERSHIP for constructs with at least one present indicator, and
+    those construct codes. Cached on the column tuple, so repeated calls on
+    same-shaped frames skip the scan and the label lookups.
+    """
+    col_pos = {col: i for i, col in enumerate(columns)}
+    rows = [i for i, ind in enumerate(_ALL_INDICATORS) if ind in col_pos]
+    positions = np.array([col_pos[_ALL_INDICATORS[i]] for i in rows], dtype=np.intp)
+
+    membership = _MEMBERSHIP[rows]
+    keep = membership.any(axis=0)
+    membership = membership[:, keep]
+    codes = tuple(code for code, k in zip(_CONSTRUCT_CODES, keep) if k)
+
+    # Shared by every cached caller
+    positions.flags.writeable = False
+    membership.flags.writeable = False
+    return positions, membership, codes
 
 
 def compute_construct_scores(indicator_means: pd.DataFrame) -> pd.DataFrame:
     """
     Compute construct scores per site from indicator-level means.
 
-    For now, construct score = mean of its indicators for that site.
+    For now, construct score = mean of its indicators for that site
+    (missing indicator values are skipped).
 
     Args:
         indicator_means: DataFrame with columns [site_id, indicator1, indicator2, ...]
 
     Returns:
-        DataFrame with columns [site_id, GPUR, GOPS, ..., EP]
+        DataFrame with columns [site_id, GPUR, GOPS, ..., EP] (float64 scores)
     """
-    # Start with site_id column
-    site_id = indicator_means[SITE_ID_COL]
-    construct_scores = pd.DataFrame({SITE_ID_COL: site_id})
-
-    for code in get_construct_codes():
-        cfg = CONSTRUCTS[code]
-        # Only keep indicators that are actually present in the DataFrame
-        indicators = [col for col in cfg.indicators if col in indicator_means.columns]
-
-        if not indicators:
-            # If no indicators available (should not happen if validation passed),
-            # we skip this construct.
-            continue
-
-        # Simple composite: mean of indicator means for this construct.
-        construct_scores[code] = indicator_means[indicators].mean(axis=1)
-
-    # Remove any accidental duplicate site_id columns
-    construct_scores = construct_scores.loc[:, ~construct_scores.columns.duplicated()]
+    # Present indicators in config order, and the constructs they cover.
+    # Constructs without any indicator column (should not happen if
+    # validation passed) are skipped.
+    positions, membership, codes = _score_layout(tuple(indicator_means.columns))
+    M = indicator_means.take(positions, axis=1).to_numpy(dtype=np.float32)
+    finite = np.isfinite(M)
+
+    # Mean of each construct's non-missing indicators for every site, as two
+    # matmuls: Σ values / number of values (same as DataFrame.mean(axis=1)).
+    sums = np.where(finite, M, 0.0) @ membership
+    counts = finite.astype(np.float32) @ membership
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scores = sums / counts
+
+    # float32 stays internal: the scores leave as float64, like the KPI columns
+    construct_scores = pd.DataFrame(
+        scores.astype(np.float64), columns=list(codes), index=indicator_means.index
+    )
+    construct_scores.insert(0, SITE_ID_COL, indicator_means[SITE_ID_COL])
 
     return construct_scores
 
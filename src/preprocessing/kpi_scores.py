@@ -15,8 +15,9 @@ This module is the KPI-side counterpart to construct_scores.py
 
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
 from src.config.model_config import CORE_KPIS, KPI_CATEGORIES
@@ -80,6 +81,14 @@ SAFETY_WEIGHTS: Dict[str, float] = {
     #"frontline_stoppages_percent": 0.05,  # optional
 }
 
+# Formative indices: name -> (high-is-better KPIs, low-is-better KPIs, weights)
+_INDEX_SPECS: Dict[str, Tuple[List[str], List[str], Dict[str, float]]] = {
+    "OE_HARD": (OE_KPIS_HIGH_IS_BETTER, OE_KPIS_LOW_IS_BETTER, OE_WEIGHTS),
+    "SAFETY_PERF": (
+        SAFETY_KPIS_HIGH_IS_BETTER, SAFETY_KPIS_LOW_IS_BETTER, SAFETY_WEIGHTS,
+    ),
+}
+
 
 
 # ---------------------------------------------------------------------------
@@ -146,23 +155,102 @@ def aggregate_kpis_per_site(df: pd.DataFrame) -> pd.DataFrame:
 # Standardisation helpers
 # ---------------------------------------------------------------------------
 
-def _standardize_series(s: pd.Series) -> pd.Series:
+def _standardize_matrix(X: np.ndarray) -> np.ndarray:
+    """
+    Standardize every column of X to z-scores: (x - mean) / std.
+
+    NaNs are ignored when computing mean/std and stay NaN in the output.
+    Constant (or all-NaN) columns become 0 for all rows to avoid NaNs.
+    The result is a new array; X is left unchanged.
+    """
+    n_valid = (~np.isnan(X)).sum(axis=0)
+
+    # All-NaN columns give 0/0 and constant columns x/0; both are zeroed below
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(X, axis=0) / n_valid
+        Z = X - mean
+        std = np.sqrt(np.nansum(Z * Z, axis=0) / n_valid)
+        Z /= std
+    Z[:, ~np.isfinite(std) | (std == 0)] = 0.0
+    return Z
+
+
+def _weighted_index(
+    Z: np.ndarray,
+    kpis: List[str],
+    weights: Dict[str, float],
+) -> np.ndarray:
     """
-    Standardize a numeric series to z-scores: (x - mean) / std.
+    Weighted sum of the columns of Z (ordered as kpis) as one dot product.
 
-    If std is 0 (constant series), returns 0 for all values to avoid NaNs.
+    KPIs without a (non-zero) weight are left out entirely, so NaNs in them
+    do not leak into the index. The sum is divided by the total weight
+    unless that is 0.
     """
-    mean = s.mean()
-    std = s.std(ddof=0)
-    if std == 0 or pd.isna(std):
-        return pd.Series(0.0, index=s.index)
-    return (s - mean) / std
+    w = np.array([weights.get(kpi, 0.0) for kpi in kpis], dtype=np.float64)
+    used = w != 0.0
+    weighted_sum = Z[:, used] @ w[used]
+
+    total_weight = w[used].sum()
+    if total_weight == 0:
+        # Fallback: avoid division by zero
+        return weighted_sum
+    return weighted_sum / total_weight
+
+
+def _row_nanmean(Z: np.ndarray) -> np.ndarray:
+    """Row means of Z ignoring NaNs (NaN for rows with no valid values)."""
+    valid = np.isfinite(Z)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(valid, Z, 0.0).sum(axis=1) / valid.sum(axis=1)
 
 
 # ---------------------------------------------------------------------------
 # Formative construct computation
 # ---------------------------------------------------------------------------
 
+def _compute_indices(
+    df: pd.DataFrame,
+    method: str = "simple",
+    names: Tuple[str, ...] = tuple(_INDEX_SPECS),
+) -> Dict[str, pd.Series]:
+    """
+    Compute formative KPI indices (OE_HARD, SAFETY_PERF) per site.
+
+    The KPIs of all requested indices are read into one matrix and z-scored
+    once; low-is-better KPIs are sign-flipped so that higher is always
+    better. Each index is then computed from its own block of columns.
+
+    method:
+        - "simple": equal-weighted average of standardized components
+        - "weighted": uses the index's weights (OE_WEIGHTS, SAFETY_WEIGHTS)
+    """
+    if method not in ("simple", "weighted"):
+        raise ValueError(f"Unknown method for {' / '.join(names)}: {method}")
+
+    kpis: List[str] = []
+    signs: List[float] = []
+    blocks: List[slice] = []
+    for name in names:
+        high, low, _ = _INDEX_SPECS[name]
+        blocks.append(slice(len(kpis), len(kpis) + len(high) + len(low)))
+        kpis += high + low
+        signs += [1.0] * len(high) + [-1.0] * len(low)
+
+    Z = _standardize_matrix(df[kpis].to_numpy(dtype=np.float64, na_value=np.nan))
+    Z *= np.array(signs)
+
+    indices: Dict[str, pd.Series] = {}
+    for name, block in zip(names, blocks):
+        if method == "simple":
+            values = _row_nanmean(Z[:, block])
+        else:
+            values = _weighted_index(Z[:, block], kpis[block], _INDEX_SPECS[name][2])
+        indices[name] = pd.Series(values, index=df.index)
+
+    return indices
+
+
 def compute_oe_hard(df: pd.DataFrame, method: str = "simple") -> pd.Series:
     """
     Compute OE_HARD (objective operational efficiency index) per site.
@@ -171,43 +259,7 @@ def compute_oe_hard(df: pd.DataFrame, method: str = "simple") -> pd.Series:
         - "simple": equal-weighted average of standardized components
         - "weighted": uses OE_WEIGHTS dictionary
     """
-    # Make a copy of needed columns
-    tmp = df.copy()
-
-    components: Dict[str, pd.Series] = {}
-
-    # High-is-better KPIs (standardized directly)
-    for kpi in OE_KPIS_HIGH_IS_BETTER:
-        components[kpi] = _standardize_series(tmp[kpi])
-
-    # Low-is-better KPIs (standardized and sign-flipped)
-    for kpi in OE_KPIS_LOW_IS_BETTER:
-        components[kpi] = -_standardize_series(tmp[kpi])
-
-    if method == "simple":
-        # Equal weights across all available components
-        comp_df = pd.DataFrame(components)
-        oe_hard = comp_df.mean(axis=1)
-    elif method == "weighted":
-        weighted_sum = pd.Series(0.0, index=df.index)
-        total_weight = 0.0
-
-        for kpi, series in components.items():
-            w = OE_WEIGHTS.get(kpi, 0.0)
-            if w == 0.0:
-                continue
-            weighted_sum += w * series
-            total_weight += w
-
-        if total_weight == 0:
-            # Fallback: avoid division by zero
-            oe_hard = weighted_sum
-        else:
-            oe_hard = weighted_sum / total_weight
-    else:
-        raise ValueError(f"Unknown method for OE_HARD: {method}")
-
-    return oe_hard
+    return _compute_indices(df, method, names=("OE_HARD",))["OE_HARD"]
 
 
 def compute_safety_perf(df: pd.DataFrame, method: str = "simple") -> pd.Series:
@@ -218,39 +270,7 @@ def compute_safety_perf(df: pd.DataFrame, method: str = "simple") -> pd.Series:
         - "simple": equal-weighted average of standardized components
         - "weighted": uses SAFETY_WEIGHTS dictionary
     """
-    tmp = df.copy()
-    components: Dict[str, pd.Series] = {}
-
-    # High-is-better KPIs
-    for kpi in SAFETY_KPIS_HIGH_IS_BETTER:
-        components[kpi] = _standardize_series(tmp[kpi])
-
-    # Low-is-better KPIs (flip sign)
-    for kpi in SAFETY_KPIS_LOW_IS_BETTER:
-        components[kpi] = -_standardize_series(tmp[kpi])
-
-    if method == "simple":
-        comp_df = pd.DataFrame(components)
-        safety_perf = comp_df.mean(axis=1)
-    elif method == "weighted":
-        weighted_sum = pd.Series(0.0, index=df.index)
-        total_weight = 0.0
-
-        for kpi, series in components.items():
-            w = SAFETY_WEIGHTS.get(kpi, 0.0)
-            if w == 0.0:
-                continue
-            weighted_sum += w * series
-            total_weight += w
-
-        if total_weight == 0:
-            safety_perf = weighted_sum
-        else:
-            safety_perf = weighted_sum / total_weight
-    else:
-        raise ValueError(f"Unknown method for SAFETY_PERF: {method}")
-
-    return safety_perf
+    return _compute_indices(df, method, names=("SAFETY_PERF",))["SAFETY_PERF"]
 
 
 def build_site_kpi_table(
@@ -273,11 +293,11 @@ def build_site_kpi_table(
             - OE_HARD
             - SAFETY_PERF
     """
-    site_kpis = aggregate_kpis_per_site(kpi_df).copy()
+    site_kpis = aggregate_kpis_per_site(kpi_df)
 
-    # Compute indices
-    site_kpis["OE_HARD"] = compute_oe_hard(site_kpis, method=method)
-    site_kpis["SAFETY_PERF"] = compute_safety_perf(site_kpis, method=method)
+    # Compute both indices from one standardized KPI matrix
+    for name, values in _compute_indices(site_kpis, method=method).items():
+        site_kpis[name] = values
 
     return site_kpis
 